@@ -1,94 +1,379 @@
 import azure.functions as func
+import asyncio
 import logging
-import json
 import os
-from datetime import datetime, timedelta
-from collections import deque
+import queue
+import threading
+import time
+from typing import Optional, TYPE_CHECKING
+
+import orjson
 
-from services.gemini_service import GeminiService
-from services.notion_service import NotionService
-from services.email_service import EmailService
 from utils.validators import validate_youtube_url, validate_request_body
-from utils.log_capture import LogCapture, LogCaptureHandler
+from utils.log_capture import (
+    LogCapture,
+    ContextLogCaptureHandler,
+    bind_log_capture,
+    detached_log_context,
+    unbind_log_capture
+)
+from utils.rate_limiter import SlidingWindowRateLimiter
+from utils.azure_credentials import get_azure_credential
+from utils.secret_cache import prefetch_secrets
 from utils.exceptions import (
+    YouTubeSummarizerError,
     InvalidYouTubeUrlError,
+    PayloadTooLargeError,
     GeminiApiError,
     NotionApiError,
     KeyVaultError
 )
 
+# Services and Azure SDKs are imported inside _initialize_services to keep worker import light
+if TYPE_CHECKING:
+    import requests
+    from services.gemini_service import GeminiService
+    from services.notion_service import NotionService
+    from services.email_service import EmailService
+    from azure.keyvault.secrets import SecretClient
+
 app = func.FunctionApp(http_auth_level=func.AuthLevel.ADMIN)
 
+# One root handler routes records to the LogCapture bound to the current
+# request/job context, so requests never add or remove handlers
+_ROOT_LOGGER = logging.getLogger()
+_log_capture_handler = ContextLogCaptureHandler()
+_log_capture_handler.setLevel(logging.INFO)
+_ROOT_LOGGER.addHandler(_log_capture_handler)
+
 # Initialize services at module level (singleton pattern)
 # This allows reuse across requests and caches Key Vault credentials
-gemini_service: GeminiService | None = None
-notion_service: NotionService | None = None
-email_service: EmailService | None = None
+gemini_service: Optional["GeminiService"] = None
+notion_service: Optional["NotionService"] = None
+email_service: Optional["EmailService"] = None
+
+# Shared Key Vault access (one HTTP pipeline for all services; see get_azure_credential)
+_secret_client: Optional["SecretClient"] = None
+_init_lock = threading.Lock()  # Serializes first-time service construction
+_services_ready = False  # Set once all services are published
+
+# App settings are fixed for the worker's lifetime, so read them once at import
+KEY_VAULT_URL = os.environ.get("KEY_VAULT_URL")
+APP_CONFIG_CONNECTION_STRING = os.environ.get("APP_CONFIG_CONNECTION_STRING")  # Optional
+EMAIL_FROM = os.environ.get("EMAIL_FROM")
+EMAIL_TO = os.environ.get("EMAIL_TO")
 
 # Rate limiting configuration (dev/testing phase)
 RATE_LIMIT_PER_HOUR = 30
-request_timestamps = deque()  # Stores timestamps of requests in the last hour
+_rate_limiter = SlidingWindowRateLimiter(RATE_LIMIT_PER_HOUR, window_minutes=60)
+
+# Concurrent summarization cap shared by both endpoints (Gemini calls in flight).
+# Both handlers run on the worker's event loop, so an asyncio semaphore suffices.
+MAX_CONCURRENT_SUMMARIES = 4
+INFLIGHT_RETRY_AFTER_SECONDS = 5
+_inflight = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+# Background processing for ytSummarizeAsync runs as tasks on the worker's event
+# loop. At most ASYNC_MAX_PENDING_JOBS jobs (running + waiting for an in-flight
+# slot) are accepted at once. _background_tasks holds strong references to these
+# jobs and to other fire-and-forget work (e.g. success emails) until they finish.
+ASYNC_MAX_PENDING_JOBS = 16
+ASYNC_RETRY_AFTER_SECONDS = 60
+_async_slots = threading.BoundedSemaphore(ASYNC_MAX_PENDING_JOBS)
+_background_tasks: set[asyncio.Task] = set()
+
+# Request bodies are a small {"url": ..., "callbackUrl": ...} object
+MAX_REQUEST_BODY_BYTES = 4096
+
+# Shared HTTP session for async-endpoint webhook callbacks (created on first use)
+# so TLS connections to the callback host are pooled across jobs
+_callback_session: Optional["requests.Session"] = None
+_callback_session_lock = threading.Lock()
+CALLBACK_POOL_MAXSIZE = MAX_CONCURRENT_SUMMARIES  # one connection per running job
+
+# Failure emails are queued and sent by one background thread; failures that
+# arrive within the batch window are coalesced into a single digest email
+FAILURE_EMAIL_QUEUE_SIZE = 100
+FAILURE_EMAIL_BATCH_WINDOW_SECONDS = 1.0
+FAILURE_EMAIL_BATCH_MAX = 10
+_failure_email_queue: "queue.Queue[dict]" = queue.Queue(maxsize=FAILURE_EMAIL_QUEUE_SIZE)
+_failure_email_thread: threading.Thread | None = None
+_failure_email_lock = threading.Lock()
+
+# Request headers worth keeping in failure reports; copying the full header
+# multidict (dozens of platform-injected entries) on every request is wasted work
+CAPTURED_REQUEST_HEADERS = ("user-agent", "x-request-id", "content-type", "content-length")
+
+# Pre-serialized bodies for constant error responses. Rejected requests are not
+# counted, so a rate-limited caller always sees exactly RATE_LIMIT_PER_HOUR.
+_ERR_INVALID_JSON = orjson.dumps({"error": "Invalid JSON format"})
+_ERR_RATE_LIMITED = orjson.dumps({
+    "error": "Rate limit exceeded",
+    "message": (
+        f"Rate limit exceeded: {RATE_LIMIT_PER_HOUR}/{RATE_LIMIT_PER_HOUR} requests in last hour. "
+        "Please try again later."
+    ),
+    "requests_in_last_hour": RATE_LIMIT_PER_HOUR
+})
+_RATE_LIMIT_LIMIT_HEADER = str(RATE_LIMIT_PER_HOUR)
+_ERR_INFLIGHT_LIMIT = orjson.dumps({
+    "error": "Too many requests in progress",
+    "message": "Another video is being summarized. Please try again shortly."
+})
+_INFLIGHT_RETRY_HEADERS = {"Retry-After": str(INFLIGHT_RETRY_AFTER_SECONDS)}
+_ERR_ASYNC_SATURATED = orjson.dumps({
+    "error": "Too many videos in progress",
+    "message": "Background processing is at capacity. Please try again later."
+})
+_ASYNC_RETRY_HEADERS = {"Retry-After": str(ASYNC_RETRY_AFTER_SECONDS)}
 
 
 def _initialize_services():
-    """Initialize services with Key Vault URL from environment."""
-    global gemini_service, notion_service, email_service
+    """
+    Initialize services with Key Vault URL from environment.
     
-    if gemini_service is None:
-        key_vault_url = os.environ.get("KEY_VAULT_URL")
+    Thread-safe and idempotent: the fast path is a lock-free flag check, and
+    the services are constructed under _init_lock. Module globals are only
+    assigned once every required service was built, so callers never observe
+    a partially initialized set.
+    """
+    global gemini_service, notion_service, email_service, _secret_client, _services_ready
+    
+    # Fast path: already initialized
+    if _services_ready:
+        return
+    
+    with _init_lock:
+        # Re-check: another thread may have finished initialization while we waited
+        if _services_ready:
+            return
+        
+        key_vault_url = KEY_VAULT_URL
         if not key_vault_url:
             raise ValueError("KEY_VAULT_URL environment variable not configured")
         
-        # Get optional App Configuration connection string
-        app_config_connection_string = os.environ.get("APP_CONFIG_CONNECTION_STRING")
-        
         logging.info("Initializing services...")
-        gemini_service = GeminiService(key_vault_url)
-        notion_service = NotionService(key_vault_url, app_config_connection_string)
         
-        # Initialize EmailService
-        from_email = os.environ.get("EMAIL_FROM")
-        to_email = os.environ.get("EMAIL_TO")
+        # Service modules (and the SDKs they pull in) load on first initialization
+        from services.gemini_service import GeminiService
+        from services.notion_service import NotionService
+        from services.email_service import EmailService
+        
+        # Build one SecretClient for all services
+        if _secret_client is None:
+            from azure.keyvault.secrets import SecretClient
+            
+            _secret_client = SecretClient(vault_url=key_vault_url, credential=get_azure_credential())
+        
+        # Fetch every service's secret in parallel; the constructors then hit the cache
+        secret_names = ["GOOGLE-API-KEY", "NOTION-API-KEY"]
+        if EMAIL_FROM and EMAIL_TO:
+            secret_names.append("ACS-CONNECTION-STRING")
+        prefetch_secrets(_secret_client, secret_names)
+        
+        new_gemini_service = GeminiService(key_vault_url, secret_client=_secret_client)
+        new_notion_service = NotionService(
+            key_vault_url,
+            APP_CONFIG_CONNECTION_STRING,
+            secret_client=_secret_client
+        )
+        
+        # Initialize EmailService (optional)
+        new_email_service = None
+        from_email = EMAIL_FROM
+        to_email = EMAIL_TO
         
         if from_email and to_email:
             try:
-                email_service = EmailService(key_vault_url, from_email, to_email)
+                new_email_service = EmailService(
+                    key_vault_url,
+                    from_email,
+                    to_email,
+                    secret_client=_secret_client
+                )
                 logging.info("EmailService initialized successfully")
             except Exception as e:
-                logging.error(f"Failed to initialize EmailService: {str(e)}. Email notifications disabled.", exc_info=True)
+                logging.error("Failed to initialize EmailService: %s. Email notifications disabled.", e, exc_info=True)
         else:
             missing_configs = []
             if not from_email:
                 missing_configs.append("EMAIL_FROM")
             if not to_email:
                 missing_configs.append("EMAIL_TO")
-            logging.warning(f"Email configuration missing: {', '.join(missing_configs)}. Email notifications disabled.")
+            logging.warning("Email configuration missing: %s. Email notifications disabled.", ', '.join(missing_configs))
+        
+        # Publish the services, then the fast-path readiness flag
+        email_service = new_email_service
+        notion_service = new_notion_service
+        gemini_service = new_gemini_service
+        _services_ready = True
         
         logging.info("Services initialized successfully")
 
 
-def _check_rate_limit() -> tuple[bool, int]:
+def _capture_headers(req: func.HttpRequest) -> dict:
+    """
+    Copy only the request headers included in failure reports.
+    
+    Args:
+        req: Incoming HTTP request
+        
+    Returns:
+        Dict of the CAPTURED_REQUEST_HEADERS present on the request
+    """
+    headers = req.headers
+    return {
+        name: value
+        for name in CAPTURED_REQUEST_HEADERS
+        if (value := headers.get(name)) is not None
+    }
+
+
+def _get_callback_session() -> "requests.Session":
+    """
+    Return the shared requests.Session used for webhook callbacks.
+    
+    The session keeps a connection pool per callback host and retries failed
+    connection attempts, so repeated callbacks skip the TCP/TLS handshake.
+    
+    Returns:
+        Shared requests.Session
+    """
+    global _callback_session
+    
+    if _callback_session is not None:
+        return _callback_session
+    
+    with _callback_session_lock:
+        if _callback_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=CALLBACK_POOL_MAXSIZE,
+                max_retries=Retry(total=2, backoff_factor=0.3)
+            ))
+            _callback_session = session
+    
+    return _callback_session
+
+
+def _json_response(
+    payload: dict | bytes,
+    status_code: int,
+    headers: dict | None = None
+) -> func.HttpResponse:
+    """
+    Build a JSON HTTP response with compact orjson serialization.
+    
+    Args:
+        payload: Response body, or pre-serialized JSON bytes
+        status_code: HTTP status code
+        headers: Additional response headers (optional)
+        
+    Returns:
+        HTTP response with application/json body
+    """
+    return func.HttpResponse(
+        body=payload if isinstance(payload, bytes) else orjson.dumps(payload),
+        status_code=status_code,
+        headers=headers,
+        mimetype="application/json"
+    )
+
+
+def _parse_request_body(req: func.HttpRequest) -> dict:
     """
-    Check if request is within rate limit (30 requests per hour).
+    Parse the JSON request body, rejecting oversized bodies before decoding.
     
+    Args:
+        req: HTTP request
+        
     Returns:
-        Tuple of (is_allowed, requests_in_last_hour)
+        Parsed JSON request body
+        
+    Raises:
+        PayloadTooLargeError: If the body exceeds MAX_REQUEST_BODY_BYTES
+        ValueError: If the body is not valid JSON
+    """
+    # Trust a declared Content-Length first so oversized bodies are never touched
+    content_length = req.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BODY_BYTES:
+        raise PayloadTooLargeError(
+            f"Request body too large: {content_length} bytes (max {MAX_REQUEST_BODY_BYTES})"
+        )
+    
+    body = req.get_body()
+    if len(body) > MAX_REQUEST_BODY_BYTES:
+        raise PayloadTooLargeError(
+            f"Request body too large: {len(body)} bytes (max {MAX_REQUEST_BODY_BYTES})"
+        )
+    return orjson.loads(body)
+
+
+def _parse_and_validate(req: func.HttpRequest) -> tuple[str, dict]:
     """
-    now = datetime.utcnow()
-    one_hour_ago = now - timedelta(hours=1)
+    Parse the request body and validate it and its YouTube URL.
     
-    # Remove timestamps older than 1 hour
-    while request_timestamps and request_timestamps[0] < one_hour_ago:
-        request_timestamps.popleft()
+    Args:
+        req: Incoming HTTP request
+        
+    Returns:
+        Tuple of (sanitized_url, request_body)
+        
+    Raises:
+        PayloadTooLargeError: If the body exceeds MAX_REQUEST_BODY_BYTES
+        ValueError: If the body is not valid JSON
+        InvalidYouTubeUrlError: If the body or URL fails validation
+    """
+    req_body = _parse_request_body(req)
+    validate_request_body(req_body)
+    return validate_youtube_url(req_body.get('url', '')), req_body
+
+
+def _spawn_background(coro) -> asyncio.Task:
+    """
+    Run a coroutine as a background task on the worker's event loop.
     
-    current_count = len(request_timestamps)
+    The task is referenced from _background_tasks until it finishes so it is
+    not garbage-collected while the handler has already returned. It runs
+    without the caller's LogCapture bound, so it can't append to a request's
+    capture after that request has unbound it.
     
-    if current_count >= RATE_LIMIT_PER_HOUR:
-        return False, current_count
+    Args:
+        coro: Coroutine to schedule
+        
+    Returns:
+        The scheduled task
+    """
+    task = asyncio.create_task(coro, context=detached_log_context())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _send_success_email(youtube_url: str, notion_url: str, summary: dict):
+    """
+    Send the success notification email from a worker thread (non-fatal).
     
-    # Add current request timestamp
-    request_timestamps.append(now)
-    return True, current_count + 1
+    Args:
+        youtube_url: Sanitized YouTube URL
+        notion_url: Created Notion page URL
+        summary: Video summary data from GeminiService
+    """
+    try:
+        await asyncio.to_thread(
+            email_service.send_success_email,
+            youtube_url=youtube_url,
+            notion_url=notion_url,
+            summary=summary
+        )
+        logging.info("Success email notification sent")
+    except Exception as e:
+        logging.warning("Failed to send success email (non-fatal): %s", e)
 
 
 def _send_failure_email(
@@ -98,7 +383,12 @@ def _send_failure_email(
     request_body: dict | None = None
 ):
     """
-    Send failure notification email with comprehensive logs.
+    Queue a failure notification email with comprehensive logs.
+    
+    Only a snapshot of the log capture is taken here; the markdown report is
+    rendered and sent on the failure-email thread, so callers never wait on
+    report generation or the email API. Failures arriving within
+    FAILURE_EMAIL_BATCH_WINDOW_SECONDS of each other are sent as one digest.
     
     Args:
         youtube_url: YouTube URL that failed processing
@@ -106,32 +396,161 @@ def _send_failure_email(
         log_capture: LogCapture instance with complete failure logs
         request_body: Original request body for context
     """
-    if email_service:
-        try:
-            markdown_report = None
-            if log_capture:
-                markdown_report = log_capture.generate_markdown_report()
-            
-            email_service.send_failure_email(
-                youtube_url=youtube_url,
-                error=error_message,
-                markdown_report=markdown_report,
-                request_body=request_body
+    if not email_service:
+        return
+    
+    failure = {
+        "youtube_url": youtube_url,
+        "error": error_message,
+        "log_capture": log_capture.snapshot() if log_capture else None,
+        "request_body": request_body
+    }
+    
+    _ensure_failure_email_worker()
+    try:
+        _failure_email_queue.put_nowait(failure)
+    except queue.Full:
+        logging.warning("Failure email queue full; dropping notification for %s", youtube_url)
+
+
+def _ensure_failure_email_worker():
+    """Start the failure-email consumer thread on first use."""
+    global _failure_email_thread
+    
+    if _failure_email_thread is not None:
+        return
+    
+    with _failure_email_lock:
+        if _failure_email_thread is None:
+            thread = threading.Thread(
+                target=_failure_email_worker,
+                name="failure-email",
+                daemon=True
             )
-            logging.info("Failure email notification sent with comprehensive logs")
-        except Exception as e:
-            logging.warning(f"Failed to send failure email (non-fatal): {str(e)}")
+            thread.start()
+            _failure_email_thread = thread
+
+
+def _failure_email_worker():
+    """
+    Drain the failure-email queue, sending each burst as a single email.
+    
+    Waits for a failure, then keeps collecting for up to
+    FAILURE_EMAIL_BATCH_WINDOW_SECONDS (or FAILURE_EMAIL_BATCH_MAX items)
+    before handing the batch to EmailService.
+    """
+    while True:
+        _deliver_failure_batch(_collect_failure_batch())
+
+
+def _collect_failure_batch() -> list[dict]:
+    """
+    Block for the next queued failure, then gather the rest of its burst.
+    
+    Returns:
+        Between 1 and FAILURE_EMAIL_BATCH_MAX queued failures
+    """
+    batch = [_failure_email_queue.get()]
+    deadline = time.monotonic() + FAILURE_EMAIL_BATCH_WINDOW_SECONDS
+    while len(batch) < FAILURE_EMAIL_BATCH_MAX:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_failure_email_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _deliver_failure_batch(batch: list[dict]):
+    """
+    Render each failure's markdown report and send the batch as one email.
+    
+    A report that fails to render is left out (the failure is still listed)
+    rather than dropping the whole batch. Send errors are logged, not raised,
+    so the worker thread keeps running.
+    
+    Args:
+        batch: Queued failures from _collect_failure_batch
+    """
+    try:
+        if not email_service:
+            return
+        for failure in batch:
+            log_capture = failure.pop("log_capture")
+            try:
+                failure["markdown_report"] = (
+                    log_capture.generate_markdown_report() if log_capture else None
+                )
+            except Exception as e:
+                logging.warning("Failed to render failure report for %s: %s", failure["youtube_url"], e)
+                failure["markdown_report"] = None
+        email_service.send_failure_email_batch(batch)
+        logging.info("Failure email notification sent with comprehensive logs (%d failures)", len(batch))
+    except Exception as e:
+        logging.warning("Failed to send failure email (non-fatal): %s", e)
+
+
+def _error_response(
+    log_capture: LogCapture,
+    error: Exception,
+    context: dict,
+    youtube_url: str,
+    error_message: str,
+    request_body: dict | None = None,
+    response_body: dict | bytes | None = None,
+    status_code: int | None = None,
+    headers: dict | None = None
+) -> func.HttpResponse:
+    """
+    Record a request failure, queue the failure email and build the error response.
+    
+    Must be called from inside the except block handling `error` so the
+    captured stack trace is the one being handled.
+    
+    Args:
+        log_capture: LogCapture for the current request
+        error: Exception being handled
+        context: Additional error context for the failure report
+        youtube_url: YouTube URL (or placeholder) shown in the failure email
+        error_message: Error description for the failure email
+        request_body: Original request body for context (optional)
+        response_body: Response payload (defaults to {"error": error.message})
+        status_code: Response status (defaults to error.status_code)
+        headers: Additional response headers (optional)
+        
+    Returns:
+        JSON error HttpResponse
+    """
+    log_capture.set_error_info(error, context)
+    
+    _send_failure_email(
+        youtube_url,
+        error_message,
+        log_capture=log_capture,
+        request_body=request_body
+    )
+    
+    if response_body is None:
+        response_body = {"error": error.message}
+    return _json_response(response_body, status_code or error.status_code, headers)
+
 
 @app.route(route="ytSummarizeToNotion", methods=["POST"])
-def ytSummarizeToNotion(req: func.HttpRequest) -> func.HttpResponse:
+async def ytSummarizeToNotion(req: func.HttpRequest) -> func.HttpResponse:
     """
     Secure Azure Function that accepts YouTube URLs and generates summaries using Gemini.
     
     This function orchestrates the video summarization workflow:
     1. Validates request and YouTube URL
     2. Summarizes video using GeminiService
-    3. (Future) Creates Notion page with NotionService
-    4. (Future) Sends email notification
+    3. Creates Notion page with NotionService
+    4. Sends email notification
+    
+    Runs as an async function: the Gemini call is awaited and blocking SDK
+    calls (Notion, email) run in worker threads, so a long summarization
+    does not pin the worker.
     
     Requires ADMIN authentication (x-functions-key header).
     Rate limited to 30 requests per hour (dev/testing phase).
@@ -142,202 +561,137 @@ def ytSummarizeToNotion(req: func.HttpRequest) -> func.HttpResponse:
     Returns:
         HTTP response with JSON summary or error message
     """
-    # Initialize log capture for this request
+    # Cap concurrent summarizations (the hourly limit only bounds arrival rate)
+    if _inflight.locked():
+        logging.warning("Concurrency limit reached: %s summaries in progress", MAX_CONCURRENT_SUMMARIES)
+        return _json_response(_ERR_INFLIGHT_LIMIT, 429, headers=_INFLIGHT_RETRY_HEADERS)
+    # Free slot and no waiters, so this acquires without suspending
+    await _inflight.acquire()
+    
+    # Initialize log capture for this request and route this context's logs to it
     log_capture = LogCapture()
+    capture_token = bind_log_capture(log_capture)
     
-    # Set up logging handler to capture all logs
-    logger = logging.getLogger()
-    log_handler = LogCaptureHandler(log_capture)
-    log_handler.setLevel(logging.INFO)
-    logger.addHandler(log_handler)
+    # Read by the catch-all handler, so bound before anything can fail
+    req_body = None
+    sanitized_url = ""
     
     try:
         logging.info('YouTube Summarize to Notion function triggered.')
         
-        # Initialize services (lazy initialization on first request)
-        _initialize_services()
-        
-        # Capture request headers (sanitized)
-        headers_dict = dict(req.headers)
-        
-        # Step 1: Check rate limit (30 requests per hour)
-        is_allowed, request_count = _check_rate_limit()
-        if not is_allowed:
-            logging.warning(f"Rate limit exceeded: {request_count} requests in the last hour")
-            
-            error_msg = f"Rate limit exceeded: {request_count}/{RATE_LIMIT_PER_HOUR} requests in last hour. Please try again later."
-            log_capture.set_error_info(
-                Exception("RateLimitExceeded"),
-                {"requests_in_last_hour": request_count, "limit": RATE_LIMIT_PER_HOUR}
-            )
-            
-            # Send failure email
-            _send_failure_email(
-                "Unknown URL",
-                error_msg,
-                log_capture=log_capture,
-                request_body=None
-            )
-            
-            return func.HttpResponse(
-                json.dumps({
-                    "error": "Rate limit exceeded",
-                    "message": error_msg,
-                    "requests_in_last_hour": request_count
-                }),
-                status_code=429,
-                mimetype="application/json"
-            )
-        
-        logging.info(f"Rate limit check passed: {request_count}/{RATE_LIMIT_PER_HOUR} requests in last hour")
-        
-        # Step 2: Parse request body
-        req_body = None
+        # Step 1: Parse request body (size is checked before JSON decoding)
         try:
-            req_body = req.get_json()
-            log_capture.set_request_data(req_body, headers_dict)
-        except ValueError as e:
-            logging.error(f"Invalid JSON in request body: {str(e)}")
-            log_capture.set_error_info(e, {"error_type": "InvalidJSON"})
-            
-            # Send failure email
-            _send_failure_email(
-                "N/A - Invalid Request",
-                f"Invalid JSON format in request: {str(e)}",
-                log_capture=log_capture,
-                request_body=None
+            req_body = _parse_request_body(req)
+            log_capture.set_request_data(req_body, _capture_headers(req))
+        except PayloadTooLargeError as e:
+            logging.error("Request body rejected: %s", e.message)
+            return _error_response(
+                log_capture, e, {"error_type": "PayloadTooLarge"},
+                "N/A - Invalid Request", e.message
             )
-            
-            return func.HttpResponse(
-                json.dumps({"error": "Invalid JSON format"}),
-                status_code=400,
-                mimetype="application/json"
+        except ValueError as e:
+            logging.error("Invalid JSON in request body: %s", e)
+            return _error_response(
+                log_capture, e, {"error_type": "InvalidJSON"},
+                "N/A - Invalid Request", f"Invalid JSON format in request: {str(e)}",
+                response_body=_ERR_INVALID_JSON, status_code=400
             )
         
         # Step 2: Validate request body structure
         try:
             validate_request_body(req_body)
         except InvalidYouTubeUrlError as e:
-            logging.error(f"Request validation failed: {e.message}")
-            log_capture.set_error_info(e, {"error_type": "ValidationError"})
-            
-            # Send failure email
-            _send_failure_email(
-                req_body.get('url', 'Invalid URL') if req_body else 'Invalid URL',
+            logging.error("Request validation failed: %s", e.message)
+            return _error_response(
+                log_capture, e, {"error_type": "ValidationError"},
+                req_body.get('url', 'Invalid URL') if isinstance(req_body, dict) else 'Invalid URL',
                 f"Request validation failed: {e.message}",
-                log_capture=log_capture,
                 request_body=req_body
             )
-            
-            return func.HttpResponse(
-                json.dumps({"error": e.message}),
-                status_code=e.status_code,
-                mimetype="application/json"
-            )
         
         # Step 3: Validate and sanitize YouTube URL
         youtube_url = ""
-        sanitized_url = ""
         try:
             youtube_url = req_body.get('url', '')
             sanitized_url = validate_youtube_url(youtube_url)
-            logging.info(f"Processing YouTube URL: {sanitized_url}")
+            logging.info("Processing YouTube URL: %s", sanitized_url)
         except InvalidYouTubeUrlError as e:
-            logging.error(f"URL validation failed: {e.message}")
-            log_capture.set_error_info(e, {
-                "error_type": "InvalidURL",
-                "provided_url": youtube_url
-            })
-            
-            # Send failure email
-            _send_failure_email(
-                youtube_url,
-                f"Invalid YouTube URL: {e.message}",
-                log_capture=log_capture,
+            logging.error("URL validation failed: %s", e.message)
+            return _error_response(
+                log_capture, e, {"error_type": "InvalidURL", "provided_url": youtube_url},
+                youtube_url, f"Invalid YouTube URL: {e.message}",
                 request_body=req_body
             )
+        
+        # Step 4: Check rate limit (30 requests per hour); invalid requests never count
+        is_allowed, request_count = _rate_limiter.allow()
+        if not is_allowed:
+            logging.warning("Rate limit exceeded: %s requests in the last hour", request_count)
             
-            return func.HttpResponse(
-                json.dumps({"error": e.message}),
-                status_code=e.status_code,
-                mimetype="application/json"
+            return _error_response(
+                log_capture,
+                Exception("RateLimitExceeded"),
+                {"requests_in_last_hour": request_count, "limit": RATE_LIMIT_PER_HOUR},
+                sanitized_url,
+                f"Rate limit exceeded: {request_count}/{RATE_LIMIT_PER_HOUR} requests in last hour. Please try again later.",
+                request_body=req_body,
+                response_body=_ERR_RATE_LIMITED,
+                status_code=429,
+                headers={
+                    "Retry-After": str(_rate_limiter.retry_after()),
+                    "RateLimit-Limit": _RATE_LIMIT_LIMIT_HEADER,
+                    "RateLimit-Remaining": "0"
+                }
             )
         
-        # Step 4: Summarize video using GeminiService
+        logging.info("Rate limit check passed: %s/%s requests in last hour", request_count, RATE_LIMIT_PER_HOUR)
+        
+        # Initialize services (no-op when already warmed at import); a cold
+        # init does blocking Key Vault/credential I/O, so keep it off the event loop
+        if not _services_ready:
+            await asyncio.to_thread(_initialize_services)
+        
+        # Step 5: Summarize video using GeminiService
         summary = None
         try:
             if gemini_service is None:
                 raise ValueError("GeminiService not initialized")
             
-            summary = gemini_service.summarize_video(sanitized_url)
+            summary = await gemini_service.summarize_video_async(sanitized_url)
             logging.info("Video summarized successfully")
             
         except KeyVaultError as e:
-            logging.error(f"Key Vault error: {e.message}")
-            log_capture.set_error_info(e, {
-                "error_type": "KeyVaultError",
-                "video_url": sanitized_url
-            })
-            
-            # Send failure email
-            _send_failure_email(
-                sanitized_url,
-                f"Configuration error (Key Vault): {e.message}",
-                log_capture=log_capture,
+            logging.error("Key Vault error: %s", e.message)
+            return _error_response(
+                log_capture, e, {"error_type": "KeyVaultError", "video_url": sanitized_url},
+                sanitized_url, f"Configuration error (Key Vault): {e.message}",
                 request_body=req_body
             )
-            
-            return func.HttpResponse(
-                json.dumps({"error": e.message}),
-                status_code=e.status_code,
-                mimetype="application/json"
-            )
         except GeminiApiError as e:
-            logging.error(f"Gemini API error: {e.message}")
-            log_capture.set_error_info(e, {
-                "error_type": "GeminiApiError",
-                "video_url": sanitized_url
-            })
-            
-            # Send failure email
-            _send_failure_email(
-                sanitized_url,
-                f"AI summarization failed: {e.message}",
-                log_capture=log_capture,
+            logging.error("Gemini API error: %s", e.message)
+            return _error_response(
+                log_capture, e, {"error_type": "GeminiApiError", "video_url": sanitized_url},
+                sanitized_url, f"AI summarization failed: {e.message}",
                 request_body=req_body
             )
-            
-            return func.HttpResponse(
-                json.dumps({"error": e.message}),
-                status_code=e.status_code,
-                mimetype="application/json"
-            )
         
-        # Step 5: Create Notion page
+        # Step 6: Create Notion page
         notion_url = None
         notion_success = False
         try:
             logging.info("Creating Notion page with summary...")
             if notion_service is None:
                 raise ValueError("NotionService not initialized")
-            notion_url = notion_service.create_page(summary)
+            notion_url = await asyncio.to_thread(notion_service.create_page, summary)
             notion_success = True
-            logging.info(f"Notion page created successfully: {notion_url}")
+            logging.info("Notion page created successfully: %s", notion_url)
             
-            # Send success email notification
+            # Send success email notification after the response (off the critical path)
             if email_service and notion_url:
-                try:
-                    email_service.send_success_email(
-                        youtube_url=sanitized_url,
-                        notion_url=notion_url,
-                        summary=summary
-                    )
-                    logging.info("Success email notification sent")
-                except Exception as e:
-                    logging.warning(f"Failed to send success email (non-fatal): {str(e)}")
+                _spawn_background(_send_success_email(sanitized_url, notion_url, summary))
             
         except NotionApiError as e:
-            logging.warning(f"Notion integration failed (non-fatal): {e.message}")
+            logging.warning("Notion integration failed (non-fatal): %s", e.message)
             log_capture.set_error_info(e, {
                 "error_type": "NotionApiError",
                 "video_url": sanitized_url,
@@ -345,19 +699,19 @@ def ytSummarizeToNotion(req: func.HttpRequest) -> func.HttpResponse:
             })
             # Don't fail the entire request - summary is still valid
         except KeyVaultError as e:
-            logging.warning(f"Notion Key Vault error (non-fatal): {e.message}")
+            logging.warning("Notion Key Vault error (non-fatal): %s", e.message)
             log_capture.set_error_info(e, {
                 "error_type": "NotionKeyVaultError",
                 "partial_success": True
             })
         except Exception as e:
-            logging.warning(f"Unexpected Notion error (non-fatal): {str(e)}")
+            logging.warning("Unexpected Notion error (non-fatal): %s", e)
             log_capture.set_error_info(e, {
                 "error_type": "UnexpectedNotionError",
                 "partial_success": True
             })
         
-        # Step 6: Return success response
+        # Step 7: Return success response
         # Return simple success/failure message - Notion page contains the full summary
         if notion_success and notion_url:
             response_data = {
@@ -382,43 +736,40 @@ def ytSummarizeToNotion(req: func.HttpRequest) -> func.HttpResponse:
                 request_body=req_body
             )
         
-        return func.HttpResponse(
-            json.dumps(response_data, indent=2),
-            status_code=200,
-            mimetype="application/json"
-        )
+        return _json_response(response_data, 200)
         
     except Exception as e:
-        # Catch-all for unexpected errors
-        logging.error(f"Unexpected error: {str(e)}", exc_info=True)
+        # Errors not handled by a specific step: report them with full logs
+        logging.error("Unexpected error: %s", e, exc_info=True)
         log_capture.set_error_info(e, {
             "error_type": "UnexpectedException",
             "critical": True
         })
         
         # Send failure email
-        youtube_url = sanitized_url if 'sanitized_url' in locals() and sanitized_url else (
-            req_body.get('url', 'Unknown') if 'req_body' in locals() and req_body else 'Unknown'
+        youtube_url = sanitized_url or (
+            req_body.get('url', 'Unknown') if isinstance(req_body, dict) else 'Unknown'
         )
         _send_failure_email(
             youtube_url,
             f"Internal server error: {str(e)}",
             log_capture=log_capture,
-            request_body=req_body if 'req_body' in locals() else None
+            request_body=req_body
         )
         
-        return func.HttpResponse(
-            json.dumps({"error": "Internal server error. Check function logs for details."}),
-            status_code=500,
-            mimetype="application/json"
-        )
+        # Application errors map to their status code; anything else is a bug or
+        # misconfiguration, so let the host fail the invocation instead of masking it
+        if isinstance(e, YouTubeSummarizerError):
+            return _json_response({"error": e.message}, e.status_code)
+        raise
     finally:
-        # Clean up log handler
-        logger.removeHandler(log_handler)
+        # Stop capturing and free the in-flight slot
+        unbind_log_capture(capture_token)
+        _inflight.release()
 
 
 @app.route(route="ytSummarizeAsync", methods=["POST"])
-def ytSummarizeAsync(req: func.HttpRequest) -> func.HttpResponse:
+async def ytSummarizeAsync(req: func.HttpRequest) -> func.HttpResponse:
     """
     Async webhook endpoint for YouTube video summarization (iOS Shortcuts compatible).
     
@@ -442,170 +793,134 @@ def ytSummarizeAsync(req: func.HttpRequest) -> func.HttpResponse:
     Returns:
         202 Accepted: Processing started, callback will be called when complete
         400 Bad Request: Invalid input
-        429 Too Many Requests: Rate limit exceeded
+        429 Too Many Requests: Background processing at capacity (Retry-After set)
     """
     try:
         logging.info('YouTube Summarize Async function triggered (webhook mode)')
         
-        # Initialize services
-        _initialize_services()
-        
-        # Parse request body
+        # Parse and validate the request body and YouTube URL
         try:
-            req_body = req.get_json()
+            sanitized_url, req_body = _parse_and_validate(req)
+            logging.info("Processing YouTube URL (async): %s", sanitized_url)
+        except YouTubeSummarizerError as e:
+            logging.error("Request rejected: %s", e.message)
+            return _json_response({"error": e.message}, e.status_code)
         except ValueError as e:
-            logging.error(f"Invalid JSON in request body: {str(e)}")
-            return func.HttpResponse(
-                json.dumps({"error": "Invalid JSON format"}),
-                status_code=400,
-                mimetype="application/json"
-            )
+            logging.error("Invalid JSON in request body: %s", e)
+            return _json_response(_ERR_INVALID_JSON, 400)
         
-        # Validate request body
-        try:
-            validate_request_body(req_body)
-        except InvalidYouTubeUrlError as e:
-            logging.error(f"Request validation failed: {e.message}")
-            return func.HttpResponse(
-                json.dumps({"error": e.message}),
-                status_code=e.status_code,
-                mimetype="application/json"
-            )
+        # Initialize services (only once the request is known to be valid),
+        # off the event loop when the import-time warm-up didn't complete
+        if not _services_ready:
+            await asyncio.to_thread(_initialize_services)
         
-        # Extract YouTube URL and callback URL
-        youtube_url = req_body.get('url', '')
         callback_url = req_body.get('callbackUrl')
         
-        # Validate YouTube URL
-        try:
-            sanitized_url = validate_youtube_url(youtube_url)
-            logging.info(f"Processing YouTube URL (async): {sanitized_url}")
-        except InvalidYouTubeUrlError as e:
-            logging.error(f"URL validation failed: {e.message}")
-            return func.HttpResponse(
-                json.dumps({"error": e.message}),
-                status_code=e.status_code,
-                mimetype="application/json"
-            )
-        
-        # Import asyncio and threading for background processing
-        import threading
-        import requests
-        
-        def process_video_async():
-            """Background thread to process video and call webhook."""
-            log_capture = LogCapture()
-            logger = logging.getLogger()
-            log_handler = LogCaptureHandler(log_capture)
-            log_handler.setLevel(logging.INFO)
-            logger.addHandler(log_handler)
-            
+        async def process_video_async():
+            """Background task to process video and call webhook."""
             try:
-                logging.info(f"[Async] Starting video processing: {sanitized_url}")
-                
-                # Step 1: Summarize video
-                summary = gemini_service.summarize_video(sanitized_url)
-                logging.info("[Async] Video summarized successfully")
-                
-                # Step 2: Create Notion page
-                notion_url = None
-                notion_success = False
-                try:
-                    notion_url = notion_service.create_page(summary)
-                    notion_success = True
-                    logging.info(f"[Async] Notion page created: {notion_url}")
+                # Wait for an in-flight slot shared with the synchronous endpoint
+                async with _inflight:
+                    log_capture = LogCapture()
+                    capture_token = bind_log_capture(log_capture)
                     
-                    # Send success email
-                    if email_service and notion_url:
+                    try:
+                        logging.info("[Async] Starting video processing: %s", sanitized_url)
+                        
+                        # Step 1: Summarize video
+                        summary = await gemini_service.summarize_video_async(sanitized_url)
+                        logging.info("[Async] Video summarized successfully")
+                        
+                        # Step 2: Create Notion page
+                        notion_url = None
+                        notion_success = False
                         try:
-                            email_service.send_success_email(
-                                youtube_url=sanitized_url,
-                                notion_url=notion_url,
-                                summary=summary
-                            )
-                            logging.info("[Async] Success email sent")
+                            notion_url = await asyncio.to_thread(notion_service.create_page, summary)
+                            notion_success = True
+                            logging.info("[Async] Notion page created: %s", notion_url)
+                            
+                            # Send success email
+                            if email_service and notion_url:
+                                await _send_success_email(sanitized_url, notion_url, summary)
+                            
                         except Exception as e:
-                            logging.warning(f"[Async] Failed to send success email: {str(e)}")
-                    
-                except Exception as e:
-                    logging.warning(f"[Async] Notion integration failed: {str(e)}")
-                
-                # Step 3: Prepare callback response
-                callback_data = {
-                    "status": "success" if notion_success else "partial_success",
-                    "youtube_url": sanitized_url,
-                    "notion_url": notion_url,
-                    "message": "Video summarized and saved to Notion" if notion_success else "Video summarized but Notion page creation failed"
-                }
-                
-                # Step 4: Call webhook callback if provided
-                if callback_url:
-                    try:
-                        logging.info(f"[Async] Calling callback URL: {callback_url}")
-                        response = requests.post(
-                            callback_url,
-                            json=callback_data,
-                            headers={"Content-Type": "application/json"},
-                            timeout=30
-                        )
-                        response.raise_for_status()
-                        logging.info(f"[Async] Callback successful: {response.status_code}")
-                    except Exception as e:
-                        logging.error(f"[Async] Callback failed: {str(e)}")
-                        # Send failure email with callback error
-                        if email_service:
+                            logging.warning("[Async] Notion integration failed: %s", e)
+                        
+                        # Step 3: Prepare callback response
+                        callback_data = {
+                            "status": "success" if notion_success else "partial_success",
+                            "youtube_url": sanitized_url,
+                            "notion_url": notion_url,
+                            "message": "Video summarized and saved to Notion" if notion_success else "Video summarized but Notion page creation failed"
+                        }
+                        
+                        # Step 4: Call webhook callback if provided
+                        if callback_url:
                             try:
-                                email_service.send_failure_email(
-                                    youtube_url=sanitized_url,
-                                    error=f"Processing succeeded but callback failed: {str(e)}",
-                                    markdown_report=log_capture.generate_markdown_report() if log_capture else None,
+                                logging.info("[Async] Calling callback URL: %s", callback_url)
+                                response = await asyncio.to_thread(
+                                    _get_callback_session().post,
+                                    callback_url,
+                                    json=callback_data,
+                                    headers={"Content-Type": "application/json"},
+                                    timeout=30
+                                )
+                                response.raise_for_status()
+                                logging.info("[Async] Callback successful: %s", response.status_code)
+                            except Exception as e:
+                                logging.error("[Async] Callback failed: %s", e)
+                                # Send failure email with callback error
+                                _send_failure_email(
+                                    sanitized_url,
+                                    f"Processing succeeded but callback failed: {str(e)}",
+                                    log_capture=log_capture,
                                     request_body=req_body
                                 )
-                            except Exception as email_err:
-                                logging.error(f"[Async] Failed to send failure email: {str(email_err)}")
-                else:
-                    logging.info("[Async] No callback URL provided, processing complete")
-                
-            except Exception as e:
-                logging.error(f"[Async] Processing failed: {str(e)}", exc_info=True)
-                
-                # Send error to callback if provided
-                if callback_url:
-                    try:
-                        error_data = {
-                            "status": "error",
-                            "youtube_url": sanitized_url,
-                            "error": str(e),
-                            "message": "Video processing failed"
-                        }
-                        requests.post(
-                            callback_url,
-                            json=error_data,
-                            headers={"Content-Type": "application/json"},
-                            timeout=30
-                        )
-                    except Exception as callback_err:
-                        logging.error(f"[Async] Error callback failed: {str(callback_err)}")
-                
-                # Send failure email
-                if email_service:
-                    try:
-                        email_service.send_failure_email(
-                            youtube_url=sanitized_url,
-                            error=str(e),
-                            markdown_report=log_capture.generate_markdown_report() if log_capture else None,
+                        else:
+                            logging.info("[Async] No callback URL provided, processing complete")
+                        
+                    except Exception as e:
+                        logging.error("[Async] Processing failed: %s", e, exc_info=True)
+                        
+                        # Send error to callback if provided
+                        if callback_url:
+                            try:
+                                error_data = {
+                                    "status": "error",
+                                    "youtube_url": sanitized_url,
+                                    "error": str(e),
+                                    "message": "Video processing failed"
+                                }
+                                await asyncio.to_thread(
+                                    _get_callback_session().post,
+                                    callback_url,
+                                    json=error_data,
+                                    headers={"Content-Type": "application/json"},
+                                    timeout=30
+                                )
+                            except Exception as callback_err:
+                                logging.error("[Async] Error callback failed: %s", callback_err)
+                        
+                        # Send failure email
+                        _send_failure_email(
+                            sanitized_url,
+                            str(e),
+                            log_capture=log_capture,
                             request_body=req_body
                         )
-                    except Exception as email_err:
-                        logging.error(f"[Async] Failed to send failure email: {str(email_err)}")
-            
+                    
+                    finally:
+                        unbind_log_capture(capture_token)
+                        logging.info("[Async] Background processing complete")
             finally:
-                logger.removeHandler(log_handler)
-                logging.info("[Async] Background processing complete")
+                # Return the pending-job slot even if cancelled before or during processing
+                _async_slots.release()
         
-        # Start background processing
-        thread = threading.Thread(target=process_video_async, daemon=True)
-        thread.start()
+        # Start background processing (reject when too many jobs are pending)
+        if not _async_slots.acquire(blocking=False):
+            logging.warning("[Async] Background processing saturated: %s jobs pending", ASYNC_MAX_PENDING_JOBS)
+            return _json_response(_ERR_ASYNC_SATURATED, 429, headers=_ASYNC_RETRY_HEADERS)
+        _spawn_background(process_video_async())
         
         # Return immediate 202 Accepted response
         response_data = {
@@ -620,19 +935,22 @@ def ytSummarizeAsync(req: func.HttpRequest) -> func.HttpResponse:
         else:
             response_data["note"] = "No callback URL provided. Check email for results."
         
-        logging.info(f"[Async] Returning 202 Accepted, background processing started")
+        logging.info("[Async] Returning 202 Accepted, background processing started")
         
-        return func.HttpResponse(
-            json.dumps(response_data, indent=2),
-            status_code=202,
-            mimetype="application/json"
-        )
+        return _json_response(response_data, 202)
         
-    except Exception as e:
-        logging.error(f"Unexpected error in async endpoint: {str(e)}", exc_info=True)
-        return func.HttpResponse(
-            json.dumps({"error": "Internal server error. Check function logs for details."}),
-            status_code=500,
-            mimetype="application/json"
-        )
+    except YouTubeSummarizerError as e:
+        logging.error("Unexpected error in async endpoint: %s", e.message, exc_info=True)
+        return _json_response({"error": e.message}, e.status_code)
+
+
 
+# Warm services during worker startup so the first request doesn't pay for
+# Key Vault and SDK setup. Failures must not break worker import; the handlers
+# call _initialize_services() again and surface the error per request.
+try:
+    _initialize_services()
+    # App Configuration and the Notion key are otherwise fetched by the first page
+    notion_service.warm_up()
+except Exception as e:
+    logging.warning("Service warm-up at import failed (will retry on first request): %s", e)
@@ -4,11 +4,33 @@ Services package for YouTube Summarizer Azure Function.
 This package contains service classes that encapsulate business logic:
 - GeminiService: AI-powered video summarization using Google Gemini
 - NotionService: Notion API integration for saving summaries
-- EmailService: Email notifications via SendGrid
+- EmailService: Email notifications via Azure Communication Services
 """
 
-from .gemini_service import GeminiService
-from .notion_service import NotionService
-from .email_service import EmailService
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .gemini_service import GeminiService
+    from .notion_service import NotionService
+    from .email_service import EmailService
 
 __all__ = ['GeminiService', 'NotionService', 'EmailService']
+
+# Service classes are resolved on first access (PEP 562) so importing one
+# service does not load the others and their SDKs
+_LAZY_EXPORTS = {
+    'GeminiService': '.gemini_service',
+    'NotionService': '.notion_service',
+    'EmailService': '.email_service',
+}
+
+
+def __getattr__(name: str):
+    """Import a service class on first attribute access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
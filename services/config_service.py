@@ -9,23 +9,25 @@ This service provides centralized configuration management with:
 """
 
 import logging
-import json
 import os
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from azure.identity import DefaultAzureCredential
+import orjson
 from azure.appconfiguration import AzureAppConfigurationClient
-from utils.exceptions import KeyVaultError
+
+
+# Local fallback for the Notion configuration (repository root)
+LOCAL_NOTION_CONFIG_PATH = Path(__file__).parent.parent / "notion_config.json"
 
 
 class ConfigService:
     """Service for loading configuration from Azure App Configuration or local files."""
     
     # Module-level cache for configuration (singleton pattern)
-    _credential: Optional[DefaultAzureCredential] = None
     _app_config_client: Optional[AzureAppConfigurationClient] = None
-    _notion_config_cache: Optional[dict] = None
+    _notion_config_cache: Optional[Mapping] = None
     
     def __init__(self, app_config_connection_string: str | None = None):
         """
@@ -90,20 +92,20 @@ class ConfigService:
             return None
         
         try:
-            logging.info(f"Loading configuration '{key}' from Azure App Configuration")
+            logging.info("Loading configuration '%s' from Azure App Configuration", key)
             config_setting = client.get_configuration_setting(key=key)
             
             if not config_setting or not config_setting.value:
-                logging.warning(f"Configuration key '{key}' not found in App Configuration")
+                logging.warning("Configuration key '%s' not found in App Configuration", key)
                 return None
             
             # Parse JSON value
-            config_data = json.loads(config_setting.value)
-            logging.info(f"Successfully loaded '{key}' from App Configuration")
+            config_data = orjson.loads(config_setting.value)
+            logging.info("Successfully loaded '%s' from App Configuration", key)
             return config_data
             
-        except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON in App Configuration key '{key}': {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logging.error("Invalid JSON in App Configuration key '%s': %s", key, e)
             return None
         except Exception as e:
             logging.warning(
@@ -114,7 +116,7 @@ class ConfigService:
     
     def _load_from_local_file(self, file_path: Path) -> dict | None:
         """
-        Load configuration from local JSON file.
+        Load configuration from local JSON file (UTF-8, optionally with BOM).
         
         Args:
             file_path: Path to JSON configuration file
@@ -123,23 +125,25 @@ class ConfigService:
             dict: Parsed JSON configuration or None if not found
         """
         if not file_path.exists():
-            logging.warning(f"Local config file not found: {file_path}")
+            logging.warning("Local config file not found: %s", file_path)
             return None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            logging.info(f"Loaded configuration from local file: {file_path}")
+            # Unbuffered binary read: one whole-file read. orjson only accepts
+            # UTF-8, so decode first to tolerate a BOM (UTF-16/32 is not supported)
+            with open(file_path, 'rb', buffering=0) as f:
+                config_data = orjson.loads(f.read().decode('utf-8-sig'))
+            logging.info("Loaded configuration from local file: %s", file_path)
             return config_data
             
-        except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON in {file_path}: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logging.error("Invalid JSON in %s: %s", file_path, e)
             return None
         except Exception as e:
-            logging.error(f"Failed to load {file_path}: {str(e)}")
+            logging.error("Failed to load %s: %s", file_path, e)
             return None
     
-    def get_notion_config(self) -> dict:
+    def get_notion_config(self) -> Mapping:
         """
         Get Notion configuration from Azure App Configuration or local file.
         
@@ -149,13 +153,14 @@ class ConfigService:
         3. Local notion_config.json file
         
         Returns:
-            dict: Notion configuration containing database_id, property_mapping, etc.
+            Mapping: Read-only Notion configuration containing database_id,
+                property_mapping, etc. (shared cache; copy with dict() to modify)
             
         Raises:
             ValueError: If configuration not found or database_id not configured
         """
         # Return cached config if available
-        if ConfigService._notion_config_cache:
+        if ConfigService._notion_config_cache is not None:
             logging.debug("Using cached Notion configuration")
             return ConfigService._notion_config_cache
         
@@ -166,8 +171,7 @@ class ConfigService:
         
         # Fall back to local file if App Configuration unavailable
         if not config_data:
-            local_path = Path(__file__).parent.parent / "notion_config.json"
-            config_data = self._load_from_local_file(local_path)
+            config_data = self._load_from_local_file(LOCAL_NOTION_CONFIG_PATH)
         
         # Validate configuration
         if not config_data:
@@ -184,11 +188,11 @@ class ConfigService:
                 "Please add your Notion database ID (see NOTION_SETUP.md)."
             )
         
-        # Cache the configuration
-        ConfigService._notion_config_cache = config_data
-        logging.info(f"Notion config loaded for database: {config_data.get('database_name', 'Unknown')}")
+        # Cache a read-only view so callers can't mutate the shared configuration
+        ConfigService._notion_config_cache = MappingProxyType(config_data)
+        logging.info("Notion config loaded for database: %s", config_data.get('database_name', 'Unknown'))
         
-        return config_data
+        return ConfigService._notion_config_cache
     
     def clear_cache(self):
         """Clear cached configuration (useful for testing or forcing reload)."""
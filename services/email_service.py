@@ -10,25 +10,37 @@ This service encapsulates email notification logic including:
 """
 
 import logging
-import os
 import base64
-from typing import Optional
-from azure.communication.email import EmailClient
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
+import html
+from typing import Optional, TYPE_CHECKING
+
+import orjson
 
 from utils.exceptions import KeyVaultError
+from utils.secret_cache import get_cached_secret
+from utils.azure_credentials import get_azure_credential, get_azure_error_type
+
+# Azure SDKs are imported on first use; email is optional and often disabled
+if TYPE_CHECKING:
+    from azure.communication.email import EmailClient
+    from azure.keyvault.secrets import SecretClient
 
 
 class EmailService:
     """Service for sending email notifications via Azure Communication Services Email."""
     
     # Module-level cache for API credentials (singleton pattern)
-    _credential: Optional[DefaultAzureCredential] = None
-    _secret_client: Optional[SecretClient] = None
-    _acs_connection_string: Optional[str] = None
+    _secret_client: Optional["SecretClient"] = None
+    _connection_string: Optional[str] = None
+    _email_client: Optional["EmailClient"] = None
     
-    def __init__(self, key_vault_url: str, from_email: str, to_email: str):
+    def __init__(
+        self,
+        key_vault_url: str,
+        from_email: str,
+        to_email: str,
+        secret_client: Optional["SecretClient"] = None
+    ):
         """
         Initialize Email service with Key Vault and sender/recipient addresses.
         
@@ -36,6 +48,7 @@ class EmailService:
             key_vault_url: Azure Key Vault URL (e.g., https://your-vault.vault.azure.net/)
             from_email: Sender email address (verified in ACS)
             to_email: Recipient email address
+            secret_client: Shared Key Vault SecretClient to reuse (optional)
             
         Raises:
             ValueError: If parameters are empty or invalid format
@@ -49,15 +62,45 @@ class EmailService:
         self.key_vault_url = key_vault_url
         self.from_email = from_email
         self.to_email = to_email
+        # Sender/recipients are fixed per instance; treated as read-only
+        self._envelope_base = {
+            "senderAddress": from_email,
+            "recipients": {
+                "to": [{"address": to_email}]
+            }
+        }
+        if secret_client is not None:
+            EmailService._secret_client = secret_client
         
         # Initialize EmailClient with connection string from Key Vault
+        self.email_client = self._initialize_client()
+        logging.info("EmailService initialized: %s -> %s", from_email, to_email)
+    
+    def _initialize_client(self) -> "EmailClient":
+        """
+        Initialize ACS EmailClient (with caching).
+        
+        The client (and its connection pool) is shared by all instances and only
+        rebuilt when the connection string changes (e.g., after key rotation).
+        
+        Returns:
+            EmailClient: Initialized ACS email client
+            
+        Raises:
+            KeyVaultError: If Key Vault access fails
+        """
         conn_str = self._get_connection_string()
-        self.email_client = EmailClient.from_connection_string(conn_str)
-        logging.info(f"EmailService initialized: {from_email} -> {to_email}")
+        
+        if EmailService._email_client is None or EmailService._connection_string != conn_str:
+            from azure.communication.email import EmailClient
+            logging.info("Initializing ACS EmailClient")
+            EmailService._email_client = EmailClient.from_connection_string(conn_str)
+            EmailService._connection_string = conn_str
+        return EmailService._email_client
     
     def _get_connection_string(self) -> str:
         """
-        Retrieve ACS connection string from Azure Key Vault (with caching).
+        Retrieve ACS connection string from Azure Key Vault (with TTL caching).
         
         Returns:
             str: Azure Communication Services connection string
@@ -65,38 +108,23 @@ class EmailService:
         Raises:
             KeyVaultError: If Key Vault access fails
         """
-        # Return cached connection string if available
-        if EmailService._acs_connection_string:
-            return EmailService._acs_connection_string
-        
         try:
-            # Initialize credential if not cached
-            if not EmailService._credential:
-                logging.info("Initializing DefaultAzureCredential for Key Vault access")
-                EmailService._credential = DefaultAzureCredential()
-            
-            # Initialize secret client if not cached
+            # Initialize secret client if not cached or shared by the caller
             if not EmailService._secret_client:
-                logging.info(f"Connecting to Key Vault: {self.key_vault_url}")
+                from azure.keyvault.secrets import SecretClient
+                
+                logging.info("Connecting to Key Vault: %s", self.key_vault_url)
                 EmailService._secret_client = SecretClient(
                     vault_url=self.key_vault_url,
-                    credential=EmailService._credential
+                    credential=get_azure_credential()
                 )
             
-            # Retrieve and cache connection string
-            logging.info("Retrieving ACS-CONNECTION-STRING from Key Vault")
-            secret = EmailService._secret_client.get_secret("ACS-CONNECTION-STRING")
-            EmailService._acs_connection_string = secret.value
-            
-            if not EmailService._acs_connection_string:
-                raise KeyVaultError("Retrieved ACS connection string is empty or None")
-            
-            logging.info("Successfully retrieved ACS connection string from Key Vault")
-            return EmailService._acs_connection_string
+            # Retrieve connection string (served from the in-process cache while fresh)
+            return get_cached_secret(EmailService._secret_client, "ACS-CONNECTION-STRING")
             
         except KeyVaultError:
             raise
-        except Exception as e:
+        except get_azure_error_type() as e:
             error_msg = f"Failed to retrieve ACS connection string from Key Vault: {str(e)}"
             logging.error(error_msg)
             raise KeyVaultError(error_msg)
@@ -118,17 +146,24 @@ class EmailService:
         title = summary.get('title', 'Unknown Video')
         brief = summary.get('brief_summary', 'No summary available')
         
+        # Summary text comes from the model and URLs from the request; escape for HTML.
+        # Model JSON may hold non-strings (null, numbers, lists): render them as text
+        safe_title = self._escape_html(str(title))
+        safe_brief = self._escape_html(str(brief))
+        safe_notion_url = self._escape_html(notion_url)
+        safe_youtube_url = self._escape_html(youtube_url)
+        
         html_content = f"""
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <h2 style="color: #0066cc;">✅ Video Summary Created</h2>
             
-            <h3>{title}</h3>
+            <h3>{safe_title}</h3>
             
-            <p><strong>Summary:</strong><br>{brief}</p>
+            <p><strong>Summary:</strong><br>{safe_brief}</p>
             
             <p>
-                <a href="{notion_url}" 
+                <a href="{safe_notion_url}" 
                    style="background-color: #0066cc; color: white; padding: 10px 20px; 
                           text-decoration: none; border-radius: 5px; display: inline-block;">
                     View in Notion
@@ -136,30 +171,14 @@ class EmailService:
             </p>
             
             <p style="color: #666; font-size: 12px;">
-                Original video: <a href="{youtube_url}">{youtube_url}</a>
+                Original video: <a href="{safe_youtube_url}">{safe_youtube_url}</a>
             </p>
         </body>
         </html>
         """
         
-        message = {
-            "senderAddress": self.from_email,
-            "recipients": {
-                "to": [{"address": self.to_email}]
-            },
-            "content": {
-                "subject": f"✅ Summary Ready: {title}",
-                "html": html_content
-            }
-        }
-        
-        try:
-            poller = self.email_client.begin_send(message)
-            result = poller.result()
-            logging.info(f"Success email sent. Message ID: {result['id']}")
-        except Exception as e:
-            logging.error(f"Failed to send success email: {str(e)}")
-            raise
+        message_id = self._send(f"✅ Summary Ready: {title}", html_content, kind="success")
+        logging.info("Success email sent. Message ID: %s", message_id)
     
     def send_failure_email(
         self, 
@@ -177,6 +196,22 @@ class EmailService:
             markdown_report: Optional markdown-formatted failure report to attach
             request_body: Optional request body data to include in email
         """
+        subject = "❌ Video Summary Failed - Diagnostic Logs Attached"
+        
+        # Nothing to attach or show beyond the error: a plain-text body is enough
+        if request_body is None and markdown_report is None:
+            plain_text = (
+                "Video Summary Failed\n\n"
+                f"Video URL: {youtube_url}\n"
+                f"Error: {error}\n\n"
+                "Please check the Azure Function logs for more details."
+            )
+            message_id = self._send(subject, plain_text=plain_text, kind="failure")
+            logging.info("Failure email sent as plain text. Message ID: %s", message_id)
+            return
+        
+        safe_youtube_url = self._escape_html(str(youtube_url))
+        
         # Build HTML content with request details
         request_details = ""
         if request_body:
@@ -207,7 +242,7 @@ class EmailService:
             {attachment_note}
             
             <p><strong>Video URL:</strong><br>
-               <a href="{youtube_url}">{youtube_url}</a>
+               <a href="{safe_youtube_url}">{safe_youtube_url}</a>
             </p>
             
             <p><strong>Error:</strong><br>
@@ -226,36 +261,144 @@ class EmailService:
         </html>
         """
         
-        message = {
-            "senderAddress": self.from_email,
-            "recipients": {
-                "to": [{"address": self.to_email}]
-            },
-            "content": {
-                "subject": "❌ Video Summary Failed - Diagnostic Logs Attached",
-                "html": html_content
-            }
-        }
-        
         # Add markdown attachment if provided
+        attachments = None
         if markdown_report:
-            attachment_content = base64.b64encode(markdown_report.encode('utf-8')).decode('utf-8')
-            message["attachments"] = [
-                {
-                    "name": "failure-report.md",
-                    "contentType": "text/markdown",
-                    "contentInBase64": attachment_content
-                }
-            ]
+            attachments = [self._markdown_attachment("failure-report.md", markdown_report)]
+        
+        message_id = self._send(subject, html_content, attachments, kind="failure")
+        logging.info("Failure email sent with %s. Message ID: %s", 'attachment' if markdown_report else 'no attachment', message_id)
+    
+    def send_failure_email_batch(self, failures: list[dict]) -> None:
+        """
+        Send several failure notifications as a single digest email.
+        
+        A batch of one is sent as a regular failure email. Larger batches list
+        every failure in one message and attach each markdown report separately.
+        
+        Args:
+            failures: send_failure_email keyword arguments, one dict per failure
+        """
+        if len(failures) == 1:
+            self.send_failure_email(**failures[0])
+            return
+        
+        rows = []
+        attachments = []
+        for i, failure in enumerate(failures, 1):
+            youtube_url = self._escape_html(str(failure.get('youtube_url', 'Unknown')))
+            markdown_report = failure.get('markdown_report')
+            report_name = f"failure-report-{i}.md" if markdown_report else "-"
+            rows.append(f"""
+                <tr>
+                    <td style="padding: 6px; border-bottom: 1px solid #ddd;">{i}</td>
+                    <td style="padding: 6px; border-bottom: 1px solid #ddd;">{youtube_url}</td>
+                    <td style="padding: 6px; border-bottom: 1px solid #ddd;"><code>{self._escape_html(failure.get('error', ''))}</code></td>
+                    <td style="padding: 6px; border-bottom: 1px solid #ddd;">{report_name}</td>
+                </tr>""")
+            if markdown_report:
+                attachments.append(self._markdown_attachment(report_name, markdown_report))
+        
+        html_content = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <h2 style="color: #cc0000;">❌ {len(failures)} Video Summaries Failed</h2>
+            
+            <table style="border-collapse: collapse; font-size: 13px;">
+                <tr>
+                    <th style="text-align: left; padding: 6px;">#</th>
+                    <th style="text-align: left; padding: 6px;">Video URL</th>
+                    <th style="text-align: left; padding: 6px;">Error</th>
+                    <th style="text-align: left; padding: 6px;">Report</th>
+                </tr>{"".join(rows)}
+            </table>
+            
+            <p style="color: #666; font-size: 12px; margin-top: 20px;">
+                Failures that occurred close together are grouped into one email.
+            </p>
+        </body>
+        </html>
+        """
+        
+        message_id = self._send(
+            f"❌ {len(failures)} Video Summaries Failed - Diagnostic Logs Attached",
+            html_content,
+            attachments,
+            kind="failure digest"
+        )
+        logging.info("Failure digest email sent (%d failures). Message ID: %s", len(failures), message_id)
+    
+    def _send(
+        self,
+        subject: str,
+        html_content: str | None = None,
+        attachments: list[dict] | None = None,
+        kind: str = "notification",
+        plain_text: str | None = None
+    ) -> str:
+        """
+        Build the ACS message envelope and send it, waiting for delivery.
+        
+        Args:
+            subject: Email subject line
+            html_content: HTML body (optional when plain_text is given)
+            attachments: ACS attachment dicts (omitted from the message when empty)
+            kind: Email kind used in the error log (e.g., "success")
+            plain_text: Plain-text body (optional when html_content is given)
+            
+        Returns:
+            str: ACS message ID
+        """
+        content = {"subject": subject}
+        if html_content is not None:
+            content["html"] = html_content
+        if plain_text is not None:
+            content["plainText"] = plain_text
+        
+        message = {**self._envelope_base, "content": content}
+        if attachments:
+            message["attachments"] = attachments
         
         try:
             poller = self.email_client.begin_send(message)
-            result = poller.result()
-            logging.info(f"Failure email sent with {'attachment' if markdown_report else 'no attachment'}. Message ID: {result['id']}")
+            return poller.result()['id']
         except Exception as e:
-            logging.error(f"Failed to send failure email: {str(e)}")
+            logging.error("Failed to send %s email: %s", kind, e)
             raise
     
+    def _markdown_attachment(self, name: str, content: str) -> dict:
+        """
+        Build an ACS attachment for a markdown report.
+        
+        Args:
+            name: Attachment file name
+            content: Markdown text
+            
+        Returns:
+            ACS attachment dict with base64-encoded content
+        """
+        return {
+            "name": name,
+            "contentType": "text/markdown",
+            "contentInBase64": self._encode_attachment(content)
+        }
+    
+    def _encode_attachment(self, content: str) -> str:
+        """
+        Base64-encode a text attachment for the ACS message payload.
+        
+        The UTF-8 bytes are released as soon as they are encoded, and the
+        base64 output is decoded as ASCII (it contains nothing else), so at
+        most two copies of the report are alive at once.
+        
+        Args:
+            content: Attachment text
+            
+        Returns:
+            Base64-encoded attachment content
+        """
+        return base64.b64encode(content.encode('utf-8')).decode('ascii')
+    
     def _escape_html(self, text: str) -> str:
         """
         Escape HTML special characters.
@@ -266,12 +409,7 @@ class EmailService:
         Returns:
             HTML-escaped text
         """
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#39;'))
+        return html.escape(text, quote=True)
     
     def _format_json_for_html(self, data: dict) -> str:
         """
@@ -283,9 +421,8 @@ class EmailService:
         Returns:
             Formatted JSON string
         """
-        import json
         try:
-            formatted = json.dumps(data, indent=2)
+            formatted = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
             return self._escape_html(formatted)
         except Exception:
             return self._escape_html(str(data))
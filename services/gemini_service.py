@@ -7,32 +7,79 @@ This service encapsulates all Google Gemini API interactions including:
 - JSON response parsing and validation
 """
 
+import asyncio
 import logging
-import json
-from typing import Optional
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
-from google import genai
-from google.genai import types
+import re
+from typing import Optional, TYPE_CHECKING
+
+import orjson
 
 from utils.exceptions import GeminiApiError, KeyVaultError
+from utils.secret_cache import get_cached_secret
+from utils.azure_credentials import get_azure_credential, get_azure_error_type
+
+# Heavy SDKs (google-genai, azure-identity, azure-keyvault) are imported on
+# first use to keep them out of worker import when services are not built
+if TYPE_CHECKING:
+    from azure.keyvault.secrets import SecretClient
+    from google import genai
+    from google.genai import types
+
+
+# Markdown code fence around the JSON payload (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Gemini model used for video summarization
+GEMINI_MODEL = 'gemini-2.5-pro'
+
+# Summarization prompt, split around the video URL (the only per-request part).
+# The 8-space indentation is part of the prompt text sent to Gemini; keep it.
+_PROMPT_PREFIX = '''
+        Please analyze this attached YouTube video and provide a comprehensive summary in JSON format.
+        Provide insights I can save on a second brain system in Notion. The Title should be the original video title from YouTube.
+        If the native language of the video is in spanish, match the summary language to spanish, otherwise use english.
+
+        Return your response as a JSON object with the following structure:
+        {
+            "title": "The original title from YouTube",
+            "tags": ["tag1", "tag2", "tag3"],
+            "url": "'''
+_PROMPT_SUFFIX = '''",
+            "brief_summary": "Concise paragraph summarizing the video content.",
+            "summary_bullets": [
+                "Key point 1",
+                "Key point 2",
+                "Key point 3"
+            ],
+            "tools_and_technologies": [
+                {
+                    "tool": "Tool name",
+                    "purpose": "What it was used for in the video"
+                }
+            ]
+        }
+        
+        Make the summary informative and actionable. Focus on key takeaways, main concepts, and practical applications.
+        '''
 
 
 class GeminiService:
     """Service for YouTube video summarization using Google Gemini AI."""
     
     # Module-level cache for API credentials (singleton pattern)
-    _credential: Optional[DefaultAzureCredential] = None
-    _secret_client: Optional[SecretClient] = None
+    _secret_client: Optional["SecretClient"] = None
     _gemini_api_key: Optional[str] = None
-    _gemini_client: Optional[genai.Client] = None
+    _gemini_client: Optional["genai.Client"] = None
+    _generate_config: Optional["types.GenerateContentConfig"] = None
+    _genai_types = None  # google.genai.types, cached on first request build
     
-    def __init__(self, key_vault_url: str):
+    def __init__(self, key_vault_url: str, secret_client: Optional["SecretClient"] = None):
         """
         Initialize Gemini service with Key Vault URL.
         
         Args:
             key_vault_url: Azure Key Vault URL (e.g., https://your-vault.vault.azure.net/)
+            secret_client: Shared Key Vault SecretClient to reuse (optional)
             
         Raises:
             ValueError: If key_vault_url is empty or invalid
@@ -41,11 +88,20 @@ class GeminiService:
             raise ValueError("key_vault_url cannot be empty")
         
         self.key_vault_url = key_vault_url
-        logging.info(f"GeminiService initialized with Key Vault: {key_vault_url}")
+        if secret_client is not None:
+            GeminiService._secret_client = secret_client
+        logging.info("GeminiService initialized with Key Vault: %s", key_vault_url)
+        
+        # Resolve the API key and client up front so warm requests skip Key Vault.
+        # Failures are non-fatal here; summarize_video() retries and surfaces them.
+        try:
+            self._initialize_client()
+        except (KeyVaultError, GeminiApiError) as e:
+            logging.warning("Deferred Gemini client initialization: %s", e.message)
     
     def _get_api_key(self) -> str:
         """
-        Retrieve Gemini API key from Azure Key Vault (with caching).
+        Retrieve Gemini API key from Azure Key Vault (with TTL caching).
         
         Returns:
             str: Gemini API key
@@ -53,45 +109,30 @@ class GeminiService:
         Raises:
             KeyVaultError: If Key Vault access fails
         """
-        # Return cached key if available
-        if GeminiService._gemini_api_key:
-            return GeminiService._gemini_api_key
-        
         try:
-            # Initialize credential if not cached
-            if not GeminiService._credential:
-                logging.info("Initializing DefaultAzureCredential for Key Vault access")
-                GeminiService._credential = DefaultAzureCredential()
-            
-            # Initialize secret client if not cached
+            # Initialize secret client if not cached or shared by the caller
             if not GeminiService._secret_client:
-                logging.info(f"Connecting to Key Vault: {self.key_vault_url}")
+                from azure.keyvault.secrets import SecretClient
+                
+                logging.info("Connecting to Key Vault: %s", self.key_vault_url)
                 GeminiService._secret_client = SecretClient(
                     vault_url=self.key_vault_url,
-                    credential=GeminiService._credential
+                    credential=get_azure_credential()
                 )
             
-            # Retrieve and cache API key
-            logging.info("Retrieving GOOGLE-API-KEY from Key Vault")
-            secret = GeminiService._secret_client.get_secret("GOOGLE-API-KEY")
-            GeminiService._gemini_api_key = secret.value
-            
-            if not GeminiService._gemini_api_key:
-                raise KeyVaultError("Retrieved API key is empty or None")
+            # Retrieve API key (served from the in-process cache while fresh)
+            return get_cached_secret(GeminiService._secret_client, "GOOGLE-API-KEY")
             
-            logging.info("Successfully retrieved Gemini API key from Key Vault")
-            return GeminiService._gemini_api_key
-            
-        except Exception as e:
+        except (get_azure_error_type(), KeyVaultError) as e:
             error_msg = (
                 "Failed to retrieve Gemini API key from Key Vault. "
                 "Ensure you're authenticated with 'az login' for local development, "
                 "or that Managed Identity is configured in Azure."
             )
-            logging.error(f"{error_msg} Details: {str(e)}")
+            logging.error("%s Details: %s", error_msg, e)
             raise KeyVaultError(error_msg, original_error=e)
     
-    def _initialize_client(self) -> genai.Client:
+    def _initialize_client(self) -> "genai.Client":
         """
         Initialize Gemini API client (with caching).
         
@@ -101,21 +142,37 @@ class GeminiService:
         Raises:
             GeminiApiError: If client initialization fails
         """
-        # Return cached client if available
-        if GeminiService._gemini_client:
-            return GeminiService._gemini_client
-        
         try:
             api_key = self._get_api_key()
+            
+            # Return cached client if it was built with the current key
+            if GeminiService._gemini_client and GeminiService._gemini_api_key == api_key:
+                return GeminiService._gemini_client
+            
+            import httpx
+            from google import genai
+            from google.genai import types
+            
             logging.info("Initializing Gemini API client")
-            GeminiService._gemini_client = genai.Client(api_key=api_key)
+            
+            # Keep-alive pool so warm requests reuse the TLS connection to
+            # generativelanguage.googleapis.com
+            http_limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+            GeminiService._gemini_client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    client_args={"limits": http_limits},
+                    async_client_args={"limits": http_limits}
+                )
+            )
+            GeminiService._gemini_api_key = api_key
             return GeminiService._gemini_client
             
         except KeyVaultError:
             raise  # Re-raise KeyVaultError as-is
         except Exception as e:
             error_msg = "Failed to initialize Gemini API client"
-            logging.error(f"{error_msg}: {str(e)}")
+            logging.error("%s: %s", error_msg, e)
             raise GeminiApiError(error_msg, original_error=e)
     
     def _build_prompt(self, youtube_url: str) -> str:
@@ -128,33 +185,7 @@ class GeminiService:
         Returns:
             str: Formatted prompt for Gemini
         """
-        prompt = f"""
-        Please analyze this attached YouTube video and provide a comprehensive summary in JSON format.
-        Provide insights I can save on a second brain system in Notion. The Title should be the original video title from YouTube.
-        If the native language of the video is in spanish, match the summary language to spanish, otherwise use english.
-
-        Return your response as a JSON object with the following structure:
-        {{
-            "title": "The original title from YouTube",
-            "tags": ["tag1", "tag2", "tag3"],
-            "url": "{youtube_url}",
-            "brief_summary": "Concise paragraph summarizing the video content.",
-            "summary_bullets": [
-                "Key point 1",
-                "Key point 2",
-                "Key point 3"
-            ],
-            "tools_and_technologies": [
-                {{
-                    "tool": "Tool name",
-                    "purpose": "What it was used for in the video"
-                }}
-            ]
-        }}
-        
-        Make the summary informative and actionable. Focus on key takeaways, main concepts, and practical applications.
-        """
-        return prompt
+        return "".join((_PROMPT_PREFIX, youtube_url, _PROMPT_SUFFIX))
     
     def _parse_response(self, response_text: str) -> dict:
         """
@@ -167,29 +198,96 @@ class GeminiService:
             dict: Parsed JSON summary or fallback structure
         """
         try:
-            # Extract JSON from markdown code blocks if present
-            if '```json' in response_text:
-                json_start = response_text.find('```json') + 7
-                json_end = response_text.find('```', json_start)
-                summary_json = json.loads(response_text[json_start:json_end].strip())
-            elif '```' in response_text:
-                json_start = response_text.find('```') + 3
-                json_end = response_text.find('```', json_start)
-                summary_json = json.loads(response_text[json_start:json_end].strip())
-            else:
-                summary_json = json.loads(response_text)
+            try:
+                # Common case: the response is plain JSON
+                summary_json = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
+                # Otherwise extract JSON from a markdown code block (single scan)
+                match = _FENCE_RE.search(response_text)
+                if not match:
+                    raise
+                summary_json = orjson.loads(match.group(1))
             
             logging.info("Successfully parsed Gemini response as JSON")
             return summary_json
             
-        except json.JSONDecodeError as e:
-            logging.warning(f"Could not parse Gemini response as JSON: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logging.warning("Could not parse Gemini response as JSON: %s", e)
             # Return fallback structure with raw response
             return {
                 "raw_response": response_text,
                 "note": "Response was not in expected JSON format"
             }
     
+    def _build_request(self, youtube_url: str) -> dict:
+        """
+        Build the generate_content arguments for a video summarization call.
+        
+        Uses LOW media resolution, which reduces token consumption by ~66%
+        (300 -> 100 tokens/second) and allows videos up to ~3 hours.
+        
+        Args:
+            youtube_url: Validated YouTube URL
+            
+        Returns:
+            dict: Keyword arguments for models.generate_content
+        """
+        # Resolve the SDK types module once instead of importing per request
+        types = GeminiService._genai_types
+        if types is None:
+            from google.genai import types
+            GeminiService._genai_types = types
+        
+        prompt = self._build_prompt(youtube_url)
+        
+        # Request config is identical for every call, so build it once per process
+        if GeminiService._generate_config is None:
+            GeminiService._generate_config = types.GenerateContentConfig(
+                media_resolution=types.MediaResolution.MEDIA_RESOLUTION_LOW
+            )
+        
+        # Log processing details
+        logging.info("Processing YouTube video: %s", youtube_url)
+        logging.info("Using LOW media resolution to prevent token limit errors")
+        logging.info("Low resolution: ~100 tokens/second vs default ~300 tokens/second")
+        logging.info("This allows processing videos up to ~3 hours instead of ~1 hour")
+        
+        return {
+            "model": GEMINI_MODEL,
+            "contents": [
+                types.Part(
+                    file_data=types.FileData(file_uri=youtube_url)
+                ),
+                types.Part(text=prompt)
+            ],
+            "config": GeminiService._generate_config
+        }
+    
+    def _process_response(self, response) -> dict:
+        """
+        Validate a Gemini response and parse its text as JSON.
+        
+        Args:
+            response: GenerateContentResponse from Gemini
+            
+        Returns:
+            dict: Parsed JSON summary or fallback structure
+            
+        Raises:
+            GeminiApiError: If Gemini returned an empty response
+        """
+        summary_text = response.text
+        if not summary_text:
+            raise GeminiApiError("Gemini returned empty response")
+        
+        logging.info("Successfully received response from Gemini (%d chars)", len(summary_text))
+        
+        # Full response bodies are large; only ship them to the log sink when debugging
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Gemini Response:\n%s", summary_text)
+        
+        return self._parse_response(summary_text)
+    
     def summarize_video(self, youtube_url: str) -> dict:
         """
         Summarize YouTube video using Gemini AI.
@@ -217,43 +315,41 @@ class GeminiService:
             KeyVaultError: If Key Vault access fails
         """
         try:
-            # Initialize client
             client = self._initialize_client()
+            response = client.models.generate_content(**self._build_request(youtube_url))
+            return self._process_response(response)
             
-            # Build prompt
-            prompt = self._build_prompt(youtube_url)
-            
-            # Log processing details
-            logging.info(f"Processing YouTube video: {youtube_url}")
-            logging.info("Using LOW media resolution to prevent token limit errors")
-            logging.info("Low resolution: ~100 tokens/second vs default ~300 tokens/second")
-            logging.info("This allows processing videos up to ~3 hours instead of ~1 hour")
-            
-            # Call Gemini API with LOW media resolution
-            # This reduces token consumption by ~66% (300 -> 100 tokens/second)
-            response = client.models.generate_content(
-                model='gemini-2.5-pro',
-                contents=[
-                    types.Part(
-                        file_data=types.FileData(file_uri=youtube_url)
-                    ),
-                    types.Part(text=prompt)
-                ],
-                config=types.GenerateContentConfig(
-                    media_resolution=types.MediaResolution.MEDIA_RESOLUTION_LOW
-                )
-            )
-            
-            # Extract and validate response
-            summary_text = response.text
-            if not summary_text:
-                raise GeminiApiError("Gemini returned empty response")
+        except KeyVaultError:
+            raise  # Re-raise KeyVaultError as-is
+        except GeminiApiError:
+            raise  # Re-raise GeminiApiError as-is
+        except Exception as e:
+            error_msg = f"Failed to process video with Gemini: {str(e)}"
+            logging.error(error_msg)
+            raise GeminiApiError(error_msg, original_error=e)
+    
+    async def summarize_video_async(self, youtube_url: str) -> dict:
+        """
+        Summarize YouTube video using the Gemini async client.
+        
+        Same behavior as summarize_video(), but awaits the Gemini call so the
+        worker's event loop can serve other requests while the video is processed.
+        
+        Args:
+            youtube_url: Validated and sanitized YouTube URL
             
-            logging.info("Successfully received response from Gemini")
-            logging.info(f"Gemini Response:\n{summary_text}")
+        Returns:
+            dict: Structured summary (see summarize_video)
             
-            # Parse and return JSON
-            return self._parse_response(summary_text)
+        Raises:
+            GeminiApiError: If video processing fails
+            KeyVaultError: If Key Vault access fails
+        """
+        try:
+            # Client setup may hit Key Vault on a cold cache, so keep it off the loop
+            client = await asyncio.to_thread(self._initialize_client)
+            response = await client.aio.models.generate_content(**self._build_request(youtube_url))
+            return self._process_response(response)
             
         except KeyVaultError:
             raise  # Re-raise KeyVaultError as-is
@@ -9,31 +9,42 @@ This service encapsulates Notion API interactions including:
 """
 
 import logging
-from typing import Optional
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
+from typing import Mapping, Optional, TYPE_CHECKING
 
 from services.config_service import ConfigService
 from utils.exceptions import NotionApiError, KeyVaultError
+from utils.secret_cache import get_cached_secret
+from utils.azure_credentials import get_azure_credential, get_azure_error_type
+
+# Azure SDKs are imported on first use to keep them out of worker import
+if TYPE_CHECKING:
+    import httpx
+    from azure.keyvault.secrets import SecretClient
 
 
 class NotionService:
     """Service for creating Notion pages from video summaries."""
     
     # Module-level cache for API credentials (singleton pattern)
-    _credential: Optional[DefaultAzureCredential] = None
-    _secret_client: Optional[SecretClient] = None
+    _secret_client: Optional["SecretClient"] = None
     _notion_api_key: Optional[str] = None
     _client = None
+    _http_client: Optional["httpx.Client"] = None
     _config_service: Optional[ConfigService] = None
     
-    def __init__(self, key_vault_url: str, app_config_connection_string: str | None = None):
+    def __init__(
+        self,
+        key_vault_url: str,
+        app_config_connection_string: str | None = None,
+        secret_client: Optional["SecretClient"] = None
+    ):
         """
         Initialize Notion service with Key Vault URL and optional App Configuration.
         
         Args:
             key_vault_url: Azure Key Vault URL (e.g., https://your-vault.vault.azure.net/)
             app_config_connection_string: Azure App Configuration connection string (optional)
+            secret_client: Shared Key Vault SecretClient to reuse (optional)
             
         Raises:
             ValueError: If key_vault_url is empty or invalid
@@ -42,16 +53,18 @@ class NotionService:
             raise ValueError("key_vault_url cannot be empty")
         
         self.key_vault_url = key_vault_url
+        if secret_client is not None:
+            NotionService._secret_client = secret_client
         
         # Initialize ConfigService
         if NotionService._config_service is None:
             NotionService._config_service = ConfigService(app_config_connection_string)
         
-        logging.info(f"NotionService initialized with Key Vault: {key_vault_url}")
+        logging.info("NotionService initialized with Key Vault: %s", key_vault_url)
     
     def _get_api_key(self) -> str:
         """
-        Retrieve Notion API key from Azure Key Vault (with caching).
+        Retrieve Notion API key from Azure Key Vault (with TTL caching).
         
         Returns:
             str: Notion API key
@@ -59,42 +72,27 @@ class NotionService:
         Raises:
             KeyVaultError: If Key Vault access fails
         """
-        # Return cached key if available
-        if NotionService._notion_api_key:
-            return NotionService._notion_api_key
-        
         try:
-            # Initialize credential if not cached
-            if not NotionService._credential:
-                logging.info("Initializing DefaultAzureCredential for Key Vault access")
-                NotionService._credential = DefaultAzureCredential()
-            
-            # Initialize secret client if not cached
+            # Initialize secret client if not cached or shared by the caller
             if not NotionService._secret_client:
-                logging.info(f"Connecting to Key Vault: {self.key_vault_url}")
+                from azure.keyvault.secrets import SecretClient
+                
+                logging.info("Connecting to Key Vault: %s", self.key_vault_url)
                 NotionService._secret_client = SecretClient(
                     vault_url=self.key_vault_url,
-                    credential=NotionService._credential
+                    credential=get_azure_credential()
                 )
             
-            # Retrieve and cache API key
-            logging.info("Retrieving NOTION-API-KEY from Key Vault")
-            secret = NotionService._secret_client.get_secret("NOTION-API-KEY")
-            NotionService._notion_api_key = secret.value
-            
-            if not NotionService._notion_api_key:
-                raise KeyVaultError("Retrieved API key is empty or None")
+            # Retrieve API key (served from the in-process cache while fresh)
+            return get_cached_secret(NotionService._secret_client, "NOTION-API-KEY")
             
-            logging.info("Successfully retrieved Notion API key from Key Vault")
-            return NotionService._notion_api_key
-            
-        except Exception as e:
+        except (get_azure_error_type(), KeyVaultError) as e:
             error_msg = (
                 "Failed to retrieve Notion API key from Key Vault. "
                 "Ensure you're authenticated with 'az login' for local development, "
                 "or that Managed Identity is configured in Azure."
             )
-            logging.error(f"{error_msg} Details: {str(e)}")
+            logging.error("%s Details: %s", error_msg, e)
             raise KeyVaultError(error_msg, original_error=e)
     
     def _initialize_client(self):
@@ -104,14 +102,27 @@ class NotionService:
         Returns:
             Client: Notion API client
         """
-        if NotionService._client is None:
-            api_key = self._get_api_key()
+        api_key = self._get_api_key()
+        
+        # Rebuild the client only when the key has changed (e.g., after rotation)
+        if NotionService._client is None or NotionService._notion_api_key != api_key:
             from notion_client import Client
+            
+            # One keep-alive pool for api.notion.com, kept across key rotations.
+            # notion-client sets base URL and auth headers on the client it is given,
+            # so this pool is dedicated to Notion rather than shared across services.
+            if NotionService._http_client is None:
+                import httpx
+                NotionService._http_client = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)
+                )
+            
             logging.info("Initializing Notion API client")
-            NotionService._client = Client(auth=api_key)
+            NotionService._client = Client(auth=api_key, client=NotionService._http_client)
+            NotionService._notion_api_key = api_key
         return NotionService._client
     
-    def _load_config(self) -> dict:
+    def _load_config(self) -> Mapping:
         """
         Load Notion configuration from Azure App Configuration or local file.
         
@@ -120,7 +131,7 @@ class NotionService:
         2. Local notion_config.json file (fallback)
         
         Returns:
-            dict: Configuration containing database_id and property_mapping
+            Mapping: Read-only configuration containing database_id and property_mapping
             
         Raises:
             NotionApiError: If config not found or database_id missing
@@ -137,6 +148,20 @@ class NotionService:
         except Exception as e:
             raise NotionApiError(f"Failed to load Notion configuration: {str(e)}")
     
+    def warm_up(self) -> None:
+        """
+        Load the Notion configuration and client ahead of the first page.
+        
+        Connects to Azure App Configuration (when configured) and fetches the
+        Notion API key so the first create_page call finds both cached.
+        
+        Raises:
+            NotionApiError: If config not found or database_id missing
+            KeyVaultError: If Key Vault access fails
+        """
+        self._load_config()
+        self._initialize_client()
+    
     def _truncate_tag(self, tag: str, max_length: int = 100) -> str:
         """
         Safely truncate a tag to the specified maximum length.
@@ -381,7 +406,7 @@ class NotionService:
             static_properties = config.get('static_properties', {})
             content_sections = config.get('content_sections', {})
             
-            logging.info(f"Creating Notion page for video: {summary_data.get('title', 'Unknown')}")
+            logging.info("Creating Notion page for video: %s", summary_data.get('title', 'Unknown'))
             
             # Build Notion API request
             properties = self._build_properties(summary_data, property_mapping, static_properties)
@@ -399,7 +424,7 @@ class NotionService:
             if not page_url:
                 raise NotionApiError("No URL returned from Notion API")
             
-            logging.info(f"Successfully created Notion page: {page_url}")
+            logging.info("Successfully created Notion page: %s", page_url)
             return page_url
             
         except NotionApiError:
@@ -410,7 +435,7 @@ class NotionService:
             raise
         except Exception as e:
             # Wrap any other exceptions
-            logging.error(f"Notion page creation failed: {str(e)}")
+            logging.error("Notion page creation failed: %s", e)
             raise NotionApiError(
                 f"Failed to create Notion page: {str(e)}",
                 original_error=e
@@ -116,13 +116,26 @@ class TestConfigService(unittest.TestCase):
         }
         
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config))):
+            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config).encode('utf-8'))):
                 service = ConfigService()
                 config = service._load_from_local_file(Path("test_config.json"))
                 
                 self.assertIsNotNone(config)
                 self.assertEqual(config['database_id'], 'local-db-id')
     
+    def test_load_from_local_file_with_bom(self):
+        """Test loading a local JSON file saved with a UTF-8 BOM."""
+        test_config = {"database_id": "bom-db-id"}
+        read_data = b'\xef\xbb\xbf' + json.dumps(test_config).encode('utf-8')
+        
+        with patch('pathlib.Path.exists', return_value=True):
+            with patch('builtins.open', unittest.mock.mock_open(read_data=read_data)):
+                service = ConfigService()
+                config = service._load_from_local_file(Path("test_config.json"))
+                
+                self.assertIsNotNone(config)
+                self.assertEqual(config['database_id'], 'bom-db-id')
+    
     def test_load_from_local_file_not_found(self):
         """Test loading from non-existent local file."""
         service = ConfigService()
@@ -173,7 +186,7 @@ class TestConfigService(unittest.TestCase):
         service = ConfigService(connection_string)
         
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config))):
+            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config).encode('utf-8'))):
                 config = service.get_notion_config()
                 
                 self.assertEqual(config['database_id'], 'local-fallback-id')
@@ -188,7 +201,7 @@ class TestConfigService(unittest.TestCase):
         service = ConfigService()
         
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config))):
+            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config).encode('utf-8'))):
                 with self.assertRaises(ValueError) as context:
                     service.get_notion_config()
                 
@@ -216,7 +229,7 @@ class TestConfigService(unittest.TestCase):
         service = ConfigService()
         
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config))) as mock_file:
+            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config).encode('utf-8'))) as mock_file:
                 # First call - should read from file
                 config1 = service.get_notion_config()
                 
@@ -241,7 +254,7 @@ class TestConfigService(unittest.TestCase):
         service = ConfigService()
         
         with patch('pathlib.Path.exists', return_value=True):
-            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config))):
+            with patch('builtins.open', unittest.mock.mock_open(read_data=json.dumps(test_config).encode('utf-8'))):
                 # Load config (caches it)
                 config = service.get_notion_config()
                 self.assertIsNotNone(ConfigService._notion_config_cache)
@@ -0,0 +1,167 @@
+"""
+Unit tests for EmailService.
+
+Tests HTML email content sent through a mocked ACS EmailClient.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from services.email_service import EmailService
+
+
+class TestEmailService(unittest.TestCase):
+    """Test cases for EmailService."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.email_client = MagicMock()
+        self.email_client.begin_send.return_value.result.return_value = {"id": "message-id"}
+
+        with patch.object(EmailService, '_initialize_client', return_value=self.email_client):
+            self.service = EmailService(
+                "https://test-vault.vault.azure.net/",
+                "sender@example.com",
+                "recipient@example.com"
+            )
+
+    def _sent_message(self) -> dict:
+        """Return the message passed to the last begin_send call."""
+        return self.email_client.begin_send.call_args.args[0]
+
+    def test_success_email_escapes_summary_fields(self):
+        """Test that model-generated text and URLs are HTML-escaped."""
+        summary = {
+            "title": "<script>alert('x')</script> Tips & Tricks",
+            "brief_summary": "Use <b> & <i> tags"
+        }
+
+        self.service.send_success_email(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=1",
+            "https://www.notion.so/page?a=1&b=2",
+            summary
+        )
+
+        html_content = self._sent_message()["content"]["html"]
+        self.assertNotIn("<script>", html_content)
+        self.assertIn("&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt; Tips &amp; Tricks", html_content)
+        self.assertIn("Use &lt;b&gt; &amp; &lt;i&gt; tags", html_content)
+        self.assertIn('href="https://www.notion.so/page?a=1&amp;b=2"', html_content)
+        self.assertIn('href="https://www.youtube.com/watch?v=dQw4w9WgXcQ&amp;t=1"', html_content)
+
+    def test_success_email_renders_non_string_summary_fields(self):
+        """Test that non-string title/summary values from the model are rendered as text."""
+        self.service.send_success_email(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://www.notion.so/page",
+            {"title": None, "brief_summary": ["<point>", 2]}
+        )
+
+        html_content = self._sent_message()["content"]["html"]
+        self.assertIn("<h3>None</h3>", html_content)
+        self.assertIn("[&#x27;&lt;point&gt;&#x27;, 2]", html_content)
+
+    def test_failure_email_escapes_video_url(self):
+        """Test that a raw (invalid) video URL is HTML-escaped in the failure email."""
+        self.service.send_failure_email(
+            'https://example.com/"><script>alert(1)</script>',
+            "Invalid YouTube URL",
+            markdown_report="# Failure Report",
+            request_body={"url": "x"}
+        )
+
+        html_content = self._sent_message()["content"]["html"]
+        self.assertNotIn("<script>", html_content)
+        self.assertIn('href="https://example.com/&quot;&gt;&lt;script&gt;', html_content)
+
+    def test_bare_failure_email_is_plain_text(self):
+        """Test that a failure email without a report or request body uses plainText."""
+        self.service.send_failure_email(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "Gemini quota exceeded"
+        )
+
+        message = self._sent_message()
+        self.assertNotIn("html", message["content"])
+        self.assertIn("Gemini quota exceeded", message["content"]["plainText"])
+        self.assertNotIn("attachments", message)
+
+    def test_failure_email_with_report_and_empty_body_is_html(self):
+        """Test that a report with an empty request body keeps the HTML layout and attachment."""
+        self.service.send_failure_email(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "Gemini quota exceeded",
+            markdown_report="# Failure Report",
+            request_body={}
+        )
+
+        message = self._sent_message()
+        self.assertIn("html", message["content"])
+        self.assertNotIn("plainText", message["content"])
+        self.assertEqual(len(message["attachments"]), 1)
+        self.assertEqual(message["attachments"][0]["name"], "failure-report.md")
+        self.assertEqual(message["attachments"][0]["contentType"], "text/markdown")
+
+    def test_failure_email_with_request_body_is_html(self):
+        """Test that a failure email with a request body uses the HTML template."""
+        self.service.send_failure_email(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "Gemini quota exceeded",
+            markdown_report="# Failure Report",
+            request_body={"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"}
+        )
+
+        message = self._sent_message()
+        self.assertIn("html", message["content"])
+        self.assertNotIn("plainText", message["content"])
+        self.assertEqual(len(message["attachments"]), 1)
+
+    def test_failure_batch_sends_one_digest_with_every_report(self):
+        """Test that a batch is sent as one message with one attachment per report."""
+        failures = [
+            {"youtube_url": f"https://www.youtube.com/watch?v=video{i:06d}", "error": f"error {i}",
+             "markdown_report": f"# Report {i}"}
+            for i in range(3)
+        ]
+
+        with patch.object(self.service, '_send', return_value="message-id") as mock_send:
+            self.service.send_failure_email_batch(failures)
+
+        mock_send.assert_called_once()
+        attachments = mock_send.call_args.args[2]
+        self.assertEqual(
+            [attachment["name"] for attachment in attachments],
+            ["failure-report-1.md", "failure-report-2.md", "failure-report-3.md"]
+        )
+        html_content = mock_send.call_args.args[1]
+        for failure in failures:
+            self.assertIn(failure["youtube_url"], html_content)
+
+    def test_failure_batch_lists_failures_without_report(self):
+        """Test that a failure without a report is listed but not attached."""
+        failures = [
+            {"youtube_url": "https://www.youtube.com/watch?v=aaaaaaaaaaa", "error": "error 1",
+             "markdown_report": "# Report 1"},
+            {"youtube_url": "https://www.youtube.com/watch?v=bbbbbbbbbbb", "error": "error 2",
+             "markdown_report": None}
+        ]
+
+        with patch.object(self.service, '_send', return_value="message-id") as mock_send:
+            self.service.send_failure_email_batch(failures)
+
+        mock_send.assert_called_once()
+        self.assertEqual(len(mock_send.call_args.args[2]), 1)
+        self.assertIn("bbbbbbbbbbb", mock_send.call_args.args[1])
+
+    def test_failure_batch_of_one_sends_regular_failure_email(self):
+        """Test that a single failure is sent as a regular failure email."""
+        failure = {"youtube_url": "https://www.youtube.com/watch?v=aaaaaaaaaaa", "error": "boom"}
+
+        with patch.object(self.service, 'send_failure_email') as mock_send_failure:
+            self.service.send_failure_email_batch([failure])
+
+        mock_send_failure.assert_called_once_with(**failure)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the function app's failure-email digest queue.
+
+Tests draining queued failures into batches and delivering each batch as a
+single EmailService call.
+"""
+
+import queue
+import unittest
+from unittest.mock import Mock, patch
+
+import function_app
+
+
+class TestFailureEmailQueue(unittest.TestCase):
+    """Test cases for _collect_failure_batch and _deliver_failure_batch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.queue = queue.Queue()
+        self.email_service = Mock()
+        patchers = [
+            patch.object(function_app, '_failure_email_queue', self.queue),
+            patch.object(function_app, 'email_service', self.email_service),
+            patch.object(function_app, 'FAILURE_EMAIL_BATCH_WINDOW_SECONDS', 0.05)
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _failure(self, i: int, log_capture=None) -> dict:
+        """Build a queued failure as _send_failure_email does."""
+        return {
+            "youtube_url": f"https://www.youtube.com/watch?v=video{i:06d}",
+            "error": f"error {i}",
+            "log_capture": log_capture,
+            "request_body": None
+        }
+
+    def test_collect_drains_queued_failures_into_one_batch(self):
+        """Test that failures queued together are collected as one batch."""
+        for i in range(3):
+            self.queue.put(self._failure(i))
+
+        batch = function_app._collect_failure_batch()
+
+        self.assertEqual(len(batch), 3)
+        self.assertTrue(self.queue.empty())
+
+    def test_collect_caps_batch_size(self):
+        """Test that a batch never exceeds FAILURE_EMAIL_BATCH_MAX failures."""
+        for i in range(function_app.FAILURE_EMAIL_BATCH_MAX + 2):
+            self.queue.put(self._failure(i))
+
+        batch = function_app._collect_failure_batch()
+
+        self.assertEqual(len(batch), function_app.FAILURE_EMAIL_BATCH_MAX)
+        self.assertEqual(self.queue.qsize(), 2)
+
+    def test_deliver_sends_one_email_with_every_report(self):
+        """Test that a batch is sent once with each rendered report."""
+        batch = []
+        for i in range(3):
+            log_capture = Mock()
+            log_capture.generate_markdown_report.return_value = f"# Report {i}"
+            batch.append(self._failure(i, log_capture))
+
+        function_app._deliver_failure_batch(batch)
+
+        self.email_service.send_failure_email_batch.assert_called_once()
+        sent = self.email_service.send_failure_email_batch.call_args.args[0]
+        self.assertEqual([f["markdown_report"] for f in sent], ["# Report 0", "# Report 1", "# Report 2"])
+        self.assertTrue(all("log_capture" not in f for f in sent))
+
+    def test_deliver_keeps_batch_when_one_report_fails(self):
+        """Test that a report that fails to render doesn't drop the batch."""
+        good_capture = Mock()
+        good_capture.generate_markdown_report.return_value = "# Report"
+        bad_capture = Mock()
+        bad_capture.generate_markdown_report.side_effect = RuntimeError("render failed")
+
+        function_app._deliver_failure_batch([self._failure(0, good_capture), self._failure(1, bad_capture)])
+
+        self.email_service.send_failure_email_batch.assert_called_once()
+        sent = self.email_service.send_failure_email_batch.call_args.args[0]
+        self.assertEqual([f["markdown_report"] for f in sent], ["# Report", None])
+
+    def test_deliver_swallows_send_errors(self):
+        """Test that an email API error doesn't escape the worker."""
+        self.email_service.send_failure_email_batch.side_effect = Exception("ACS unavailable")
+
+        function_app._deliver_failure_batch([self._failure(0)])
+
+        self.email_service.send_failure_email_batch.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
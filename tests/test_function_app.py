@@ -0,0 +1,38 @@
+"""
+Unit tests for the function app HTTP handlers.
+
+Tests request validation responses without calling any Azure services.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+import function_app
+
+
+class TestSummarizeToNotionValidation(unittest.TestCase):
+    """Test cases for ytSummarizeToNotion request validation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Registered handlers are FunctionBuilders; unwrap the user function
+        self.handler = function_app.ytSummarizeToNotion.build().get_user_function()
+
+    def _request(self, body: bytes) -> Mock:
+        """Build a minimal HttpRequest stand-in."""
+        req = Mock()
+        req.headers = {"content-type": "application/json"}
+        req.get_body.return_value = body
+        return req
+
+    @patch.object(function_app, 'email_service', None)
+    def test_non_object_json_body_is_client_error(self):
+        """Test that a JSON array body is rejected with 400, not an unhandled error."""
+        response = asyncio.run(self.handler(self._request(b'[1]')))
+
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Unit tests for GeminiService response parsing.
+
+Tests JSON extraction from plain and markdown-fenced Gemini responses.
+"""
+
+import unittest
+
+from services.gemini_service import GeminiService
+
+
+class TestGeminiResponseParsing(unittest.TestCase):
+    """Test cases for GeminiService._parse_response."""
+
+    def setUp(self):
+        """Set up test fixtures without touching Key Vault."""
+        self.service = GeminiService.__new__(GeminiService)
+
+    def test_parse_plain_json(self):
+        """Test parsing a plain JSON response."""
+        result = self.service._parse_response('{"title": "Video", "tags": ["a"]}')
+
+        self.assertEqual(result['title'], 'Video')
+        self.assertEqual(result['tags'], ['a'])
+
+    def test_parse_json_fence(self):
+        """Test extracting JSON from a ```json fenced block."""
+        text = 'Here is the summary:\n```json\n{"title": "Fenced"}\n```\nDone.'
+
+        result = self.service._parse_response(text)
+
+        self.assertEqual(result['title'], 'Fenced')
+
+    def test_parse_bare_fence(self):
+        """Test extracting JSON from a fence without a language tag."""
+        result = self.service._parse_response('```\n{"title": "Bare"}\n```')
+
+        self.assertEqual(result['title'], 'Bare')
+
+    def test_plain_json_containing_backticks(self):
+        """Test that backticks inside JSON strings don't trigger fence extraction."""
+        text = '{"title": "Use ```code``` blocks"}'
+
+        result = self.service._parse_response(text)
+
+        self.assertEqual(result['title'], 'Use ```code``` blocks')
+
+    def test_invalid_json_fallback(self):
+        """Test fallback structure when the response is not JSON."""
+        result = self.service._parse_response('not json at all')
+
+        self.assertEqual(result['raw_response'], 'not json at all')
+        self.assertIn('note', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
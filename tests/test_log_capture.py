@@ -6,7 +6,14 @@ and formats failure information for email notifications.
 """
 
 import logging
-from utils.log_capture import LogCapture, LogCaptureHandler
+from utils.log_capture import (
+    LogCapture,
+    LogCaptureHandler,
+    ContextLogCaptureHandler,
+    bind_log_capture,
+    detached_log_context,
+    unbind_log_capture
+)
 
 
 def test_log_capture_basic():
@@ -115,6 +122,77 @@ def test_log_capture_handler():
     logger.removeHandler(handler)
 
 
+def test_log_capture_handler_defers_formatting():
+    """Test that handler records are rendered in order only when read."""
+    log_capture = LogCapture()
+    handler = LogCaptureHandler(log_capture)
+    
+    logger = logging.getLogger("test_deferred_logger")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    # Keep records away from root handlers (e.g. function_app's context handler)
+    logger.propagate = False
+    
+    logger.info("Processing %s", "video-1")
+    log_capture.add_log("WARNING", "Manual entry")
+    logger.error("Failed: %d retries", 2)
+    
+    logger.removeHandler(handler)
+    
+    messages = [entry["message"] for entry in log_capture.log_buffer]
+    assert messages == ["Processing video-1", "Manual entry", "Failed: 2 retries"]
+    assert log_capture.log_buffer[2]["level"] == "ERROR"
+
+
+def test_context_log_capture_handler():
+    """Test that the context handler only captures while a LogCapture is bound."""
+    log_capture = LogCapture()
+    handler = ContextLogCaptureHandler()
+    
+    logger = logging.getLogger("test_context_logger")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    # Keep records away from root handlers (e.g. function_app's context handler)
+    logger.propagate = False
+    
+    logger.info("Before binding")
+    token = bind_log_capture(log_capture)
+    try:
+        logger.info("While bound")
+    finally:
+        unbind_log_capture(token)
+    logger.info("After unbinding")
+    
+    logger.removeHandler(handler)
+    
+    messages = [entry["message"] for entry in log_capture.log_buffer]
+    assert messages == ["While bound"]
+
+
+def test_detached_log_context():
+    """Test that a detached context drops the bound LogCapture."""
+    log_capture = LogCapture()
+    handler = ContextLogCaptureHandler()
+    
+    logger = logging.getLogger("test_detached_logger")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    token = bind_log_capture(log_capture)
+    try:
+        context = detached_log_context()
+        logger.info("Bound request")
+        context.run(logger.info, "Background task")
+    finally:
+        unbind_log_capture(token)
+    
+    logger.removeHandler(handler)
+    
+    messages = [entry["message"] for entry in log_capture.log_buffer]
+    assert messages == ["Bound request"]
+
+
 if __name__ == "__main__":
     print("Running log capture tests...")
     test_log_capture_basic()
@@ -132,4 +210,13 @@ if __name__ == "__main__":
     test_log_capture_handler()
     print("✓ Log capture handler test passed")
     
+    test_log_capture_handler_defers_formatting()
+    print("✓ Deferred formatting test passed")
+    
+    test_context_log_capture_handler()
+    print("✓ Context log capture handler test passed")
+    
+    test_detached_log_context()
+    print("✓ Detached log context test passed")
+    
     print("\nAll tests passed! ✅")
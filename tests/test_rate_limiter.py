@@ -0,0 +1,48 @@
+"""
+Unit tests for the sliding-window rate limiter.
+
+Tests per-minute bucket counting and expiry of the rolling window.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from utils.rate_limiter import SlidingWindowRateLimiter
+
+
+class TestSlidingWindowRateLimiter(unittest.TestCase):
+    """Test cases for SlidingWindowRateLimiter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.limiter = SlidingWindowRateLimiter(3, window_minutes=60)
+
+    def test_rejects_after_limit(self):
+        """Test that requests beyond the limit are rejected and not counted."""
+        with patch('utils.rate_limiter.time.monotonic', return_value=600.0):
+            results = [self.limiter.allow() for _ in range(4)]
+
+        self.assertEqual(results[:3], [(True, 1), (True, 2), (True, 3)])
+        self.assertEqual(results[3], (False, 3))
+
+    def test_old_requests_leave_window(self):
+        """Test that requests older than the window no longer count."""
+        with patch('utils.rate_limiter.time.monotonic', return_value=600.0):
+            for _ in range(3):
+                self.limiter.allow()
+
+        with patch('utils.rate_limiter.time.monotonic', return_value=600.0 + 3600):
+            self.assertEqual(self.limiter.allow(), (True, 1))
+
+    def test_retry_after_tracks_oldest_minute(self):
+        """Test that retry_after points at the oldest counted minute's expiry."""
+        with patch('utils.rate_limiter.time.monotonic', return_value=600.0):
+            self.limiter.allow()
+
+        with patch('utils.rate_limiter.time.monotonic', return_value=900.0):
+            self.limiter.allow()
+            self.assertEqual(self.limiter.retry_after(), 600 + 3600 - 900)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit tests for the Key Vault secret cache.
+
+Tests TTL-based reuse of secrets across service instances.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from utils import secret_cache
+from utils.secret_cache import get_cached_secret, clear_secret_cache, prefetch_secrets
+from utils.exceptions import KeyVaultError
+
+
+class TestSecretCache(unittest.TestCase):
+    """Test cases for get_cached_secret."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        clear_secret_cache()
+        self.secret_client = Mock()
+        self.secret_client.get_secret.return_value = Mock(value="secret-value")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        clear_secret_cache()
+
+    def test_secret_fetched_once_while_fresh(self):
+        """Test that repeated lookups are served from the cache."""
+        first = get_cached_secret(self.secret_client, "GOOGLE-API-KEY")
+        second = get_cached_secret(self.secret_client, "GOOGLE-API-KEY")
+
+        self.assertEqual(first, "secret-value")
+        self.assertEqual(second, "secret-value")
+        self.secret_client.get_secret.assert_called_once_with("GOOGLE-API-KEY")
+
+    def test_secret_refetched_after_ttl(self):
+        """Test that an expired secret is fetched again from Key Vault."""
+        with patch('utils.secret_cache.time.monotonic', return_value=1000.0):
+            get_cached_secret(self.secret_client, "GOOGLE-API-KEY")
+
+        expired = 1000.0 + secret_cache.SECRET_CACHE_TTL_SECONDS + 1
+        with patch('utils.secret_cache.time.monotonic', return_value=expired):
+            get_cached_secret(self.secret_client, "GOOGLE-API-KEY")
+
+        self.assertEqual(self.secret_client.get_secret.call_count, 2)
+
+    def test_empty_secret_not_cached(self):
+        """Test that empty secrets raise KeyVaultError and are not cached."""
+        self.secret_client.get_secret.return_value = Mock(value=None)
+
+        with self.assertRaises(KeyVaultError):
+            get_cached_secret(self.secret_client, "NOTION-API-KEY")
+
+        self.assertNotIn("NOTION-API-KEY", secret_cache._secret_cache)
+
+    def test_prefetch_secrets_fills_cache(self):
+        """Test that prefetched secrets are served from the cache afterwards."""
+        prefetch_secrets(self.secret_client, ["GOOGLE-API-KEY", "NOTION-API-KEY"])
+        get_cached_secret(self.secret_client, "GOOGLE-API-KEY")
+        get_cached_secret(self.secret_client, "NOTION-API-KEY")
+
+        self.assertEqual(self.secret_client.get_secret.call_count, 2)
+
+    def test_prefetch_secrets_ignores_failures(self):
+        """Test that a failed prefetch does not raise or cache the secret."""
+        self.secret_client.get_secret.side_effect = Exception("Vault unavailable")
+
+        prefetch_secrets(self.secret_client, ["GOOGLE-API-KEY"])
+
+        self.assertNotIn("GOOGLE-API-KEY", secret_cache._secret_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
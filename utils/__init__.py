@@ -10,6 +10,7 @@ from .validators import validate_youtube_url, validate_request_body
 from .exceptions import (
     YouTubeSummarizerError, 
     InvalidYouTubeUrlError, 
+    PayloadTooLargeError, 
     GeminiApiError, 
     NotionApiError, 
     KeyVaultError
@@ -20,6 +21,7 @@ __all__ = [
     'validate_request_body',
     'YouTubeSummarizerError', 
     'InvalidYouTubeUrlError', 
+    'PayloadTooLargeError', 
     'GeminiApiError', 
     'NotionApiError', 
     'KeyVaultError'
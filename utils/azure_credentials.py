@@ -0,0 +1,89 @@
+"""
+Process-wide Azure credential for Key Vault access.
+
+Building a credential walks (and probes) its source chain, so one instance is
+created per worker process and shared by the function app and every service.
+"""
+
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
+
+# azure-identity is imported on first use to keep it out of worker import
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+
+
+# Token scope for Azure Key Vault
+KEY_VAULT_SCOPE = "https://vault.azure.net/.default"
+
+_credential: Optional["TokenCredential"] = None
+_credential_lock = threading.Lock()
+
+
+def get_azure_credential() -> "TokenCredential":
+    """
+    Return the shared Azure credential, building it on first use.
+
+    In Azure (WEBSITE_INSTANCE_ID is set by App Service/Functions) only Managed
+    Identity applies, so it is used directly instead of walking the
+    DefaultAzureCredential chain. Locally, DefaultAzureCredential is used with
+    credential sources that never apply to this app excluded.
+
+    Returns:
+        Credential for Azure SDK clients
+    """
+    global _credential
+
+    if _credential is not None:
+        return _credential
+
+    with _credential_lock:
+        if _credential is None:
+            _credential = _build_credential()
+    return _credential
+
+
+def _build_credential() -> "TokenCredential":
+    """Build the credential for the current environment (see get_azure_credential)."""
+    if os.environ.get("WEBSITE_INSTANCE_ID"):
+        from azure.identity import ManagedIdentityCredential
+
+        logging.info("Using ManagedIdentityCredential for Key Vault access")
+        # AZURE_CLIENT_ID selects a user-assigned identity; None means system-assigned
+        credential = ManagedIdentityCredential(client_id=os.environ.get("AZURE_CLIENT_ID"))
+
+        # Acquire the Key Vault token now so the first secret read reuses it
+        try:
+            credential.get_token(KEY_VAULT_SCOPE)
+        except Exception as e:
+            logging.warning("Managed Identity token pre-fetch failed: %s", e)
+        return credential
+
+    from azure.identity import DefaultAzureCredential
+
+    logging.info("Using DefaultAzureCredential for Key Vault access")
+    return DefaultAzureCredential(
+        exclude_interactive_browser_credential=True,
+        exclude_visual_studio_code_credential=True,
+        exclude_shared_token_cache_credential=True,
+        exclude_powershell_credential=True
+    )
+
+
+@lru_cache(maxsize=None)
+def get_azure_error_type() -> type[Exception]:
+    """
+    Return azure-core's AzureError, importing azure-core on first use.
+
+    Meant for except clauses, which are only evaluated while an exception is
+    being matched, so successful calls never touch the import system.
+
+    Returns:
+        The azure.core.exceptions.AzureError class
+    """
+    from azure.core.exceptions import AzureError
+
+    return AzureError
@@ -38,6 +38,18 @@ class InvalidYouTubeUrlError(YouTubeSummarizerError):
         super().__init__(message, status_code=400)
 
 
+class PayloadTooLargeError(YouTubeSummarizerError):
+    """
+    Raised when the request body exceeds the accepted size.
+    
+    Requests only carry a small JSON object, so oversized bodies are
+    rejected before any JSON decoding is attempted.
+    """
+    
+    def __init__(self, message: str):
+        super().__init__(message, status_code=413)
+
+
 class GeminiApiError(YouTubeSummarizerError):
     """
     Raised when Gemini API call fails.
@@ -8,20 +8,84 @@ request processing for inclusion in failure email notifications.
 import logging
 import json
 import traceback
+from contextvars import Context, ContextVar, Token, copy_context
 from datetime import datetime
-from typing import Any
 from io import StringIO
 
 
+# Formatter applied to buffered records when they are rendered
+_RECORD_FORMATTER = logging.Formatter()
+
+# LogCapture bound to the current request/job context (None outside one).
+# asyncio tasks and asyncio.to_thread copy the context, so their logs follow.
+_current_capture: ContextVar["LogCapture | None"] = ContextVar("log_capture", default=None)
+
+
 class LogCapture:
     """Captures log entries and request context for failure analysis."""
     
     def __init__(self):
         """Initialize log capture with empty buffer."""
-        self.log_buffer = []
+        self._log_entries = []
+        self._pending_records = []
         self.request_data = {}
         self.error_info = {}
         self.start_time = datetime.utcnow()
+        self.end_time = None
+    
+    @property
+    def log_buffer(self) -> list[dict]:
+        """
+        Captured log entries, rendering any buffered log records first.
+        
+        Returns:
+            List of {"timestamp", "level", "message"} dicts in log order
+        """
+        if self._pending_records:
+            self._flush_records()
+        return self._log_entries
+    
+    def _flush_records(self):
+        """Format buffered LogRecords into log entries."""
+        for record in self._pending_records:
+            self._log_entries.append({
+                "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
+                "level": record.levelname,
+                "message": _RECORD_FORMATTER.format(record)
+            })
+        self._pending_records.clear()
+    
+    def snapshot(self) -> "LogCapture":
+        """
+        Copy the captured state so a report can be rendered elsewhere.
+        
+        Buffered records are copied unformatted, so this is cheap on the
+        request path; the copy is frozen at the current time for the report's
+        duration and is unaffected by logs emitted afterwards.
+        
+        Returns:
+            Independent LogCapture holding the state captured so far
+        """
+        copy = LogCapture.__new__(LogCapture)
+        copy._log_entries = list(self._log_entries)
+        copy._pending_records = list(self._pending_records)
+        copy.request_data = self.request_data
+        copy.error_info = self.error_info
+        copy.start_time = self.start_time
+        copy.end_time = datetime.utcnow()
+        return copy
+    
+    def add_record(self, record: logging.LogRecord):
+        """
+        Buffer a log record without formatting it.
+        
+        Records are only rendered when the buffer is read (i.e. when a failure
+        report is generated), so successful requests skip formatting entirely.
+        
+        Args:
+            record: Log record to capture
+        """
+        self._pending_records.append(record)
     
     def add_log(self, level: str, message: str):
         """
@@ -99,7 +163,7 @@ class LogCapture:
         Returns:
             Markdown-formatted failure report
         """
-        duration = (datetime.utcnow() - self.start_time).total_seconds()
+        duration = ((self.end_time or datetime.utcnow()) - self.start_time).total_seconds()
         
         md = StringIO()
         md.write("# Azure Functions Failure Report\n\n")
@@ -183,13 +247,76 @@ class LogCaptureHandler(logging.Handler):
     
     def emit(self, record: logging.LogRecord):
         """
-        Emit a log record to the LogCapture buffer.
+        Emit a log record to the LogCapture buffer (formatted lazily).
+        
+        Args:
+            record: Log record to capture
+        """
+        try:
+            self.log_capture.add_record(record)
+        except Exception:
+            self.handleError(record)
+
+
+class ContextLogCaptureHandler(logging.Handler):
+    """
+    Logging handler that routes records to the LogCapture bound to the current context.
+    
+    Installed once on the root logger; requests bind their LogCapture with
+    bind_log_capture() instead of adding and removing a handler per request,
+    which keeps concurrent requests' logs apart.
+    """
+    
+    def emit(self, record: logging.LogRecord):
+        """
+        Emit a log record to the current context's LogCapture, if any.
         
         Args:
             record: Log record to capture
         """
+        log_capture = _current_capture.get()
+        if log_capture is None:
+            return
         try:
-            msg = self.format(record)
-            self.log_capture.add_log(record.levelname, msg)
+            log_capture.add_record(record)
         except Exception:
             self.handleError(record)
+
+
+def bind_log_capture(log_capture: LogCapture) -> Token:
+    """
+    Route logs emitted in the current context to a LogCapture.
+    
+    Args:
+        log_capture: LogCapture for the current request or job
+        
+    Returns:
+        Token to pass to unbind_log_capture()
+    """
+    return _current_capture.set(log_capture)
+
+
+def unbind_log_capture(token: Token):
+    """
+    Restore the LogCapture binding that was active before bind_log_capture().
+    
+    Args:
+        token: Token returned by bind_log_capture()
+    """
+    _current_capture.reset(token)
+
+
+def detached_log_context() -> Context:
+    """
+    Copy the current context with no LogCapture bound.
+    
+    Background tasks copy the context they are created in; running them in
+    this context instead keeps them from writing into the creating request's
+    capture after that request has finished.
+    
+    Returns:
+        Context to pass to asyncio.create_task(..., context=...)
+    """
+    context = copy_context()
+    context.run(_current_capture.set, None)
+    return context
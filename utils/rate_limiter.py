@@ -0,0 +1,84 @@
+"""
+In-process sliding-window rate limiter.
+
+Requests are counted in fixed per-minute buckets keyed by monotonic time, so
+each check is constant work with no timestamp allocations and is unaffected
+by wall-clock jumps. State is per worker process; a shared store (e.g. Redis)
+would be needed to enforce a limit across scaled-out instances.
+"""
+
+import threading
+import time
+
+
+class SlidingWindowRateLimiter:
+    """Rolling-window request limiter built from per-minute counters."""
+
+    __slots__ = ("limit", "window_minutes", "_counts", "_minutes", "_lock")
+
+    def __init__(self, limit: int, window_minutes: int = 60):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limit: Maximum requests allowed within the window
+            window_minutes: Window length in minutes (one bucket per minute)
+        """
+        self.limit = limit
+        self.window_minutes = window_minutes
+        self._counts = [0] * window_minutes  # Request count per minute slot
+        self._minutes = [0] * window_minutes  # Minute each slot was last reset for
+        self._lock = threading.Lock()
+
+    def allow(self) -> tuple[bool, int]:
+        """
+        Check the limit and count the request if it is allowed.
+
+        Returns:
+            Tuple of (is_allowed, requests_in_window). Rejected requests are not
+            counted, so a rejection always reports exactly `limit`.
+        """
+        minute = int(time.monotonic() // 60)
+        idx = minute % self.window_minutes
+
+        with self._lock:
+            # Lazily reset the current slot when it still holds an older minute
+            if self._minutes[idx] != minute:
+                self._minutes[idx] = minute
+                self._counts[idx] = 0
+
+            current_count = self._count_in_window(minute)
+            if current_count >= self.limit:
+                return False, current_count
+
+            self._counts[idx] += 1
+            return True, current_count + 1
+
+    def retry_after(self) -> int:
+        """
+        Compute seconds until the oldest counted minute leaves the window.
+
+        Returns:
+            Seconds a rate-limited caller should wait (at least 1)
+        """
+        now = time.monotonic()
+        minute = int(now // 60)
+
+        with self._lock:
+            oldest_minute = min(
+                (
+                    bucket_minute
+                    for count, bucket_minute in zip(self._counts, self._minutes)
+                    if count and minute - bucket_minute < self.window_minutes
+                ),
+                default=minute
+            )
+        return max(1, int((oldest_minute + self.window_minutes) * 60 - now))
+
+    def _count_in_window(self, minute: int) -> int:
+        """Sum the slots that fall within the window (skipped minutes stay stale)."""
+        return sum(
+            count
+            for count, bucket_minute in zip(self._counts, self._minutes)
+            if minute - bucket_minute < self.window_minutes
+        )
@@ -0,0 +1,80 @@
+"""
+In-process cache for Azure Key Vault secrets.
+
+Each Key Vault read costs an Azure AD token round-trip and is billed per
+operation, so secrets are cached at module level (shared across services and
+warm invocations) and only re-fetched once their TTL expires.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.exceptions import KeyVaultError
+
+
+# How long a retrieved secret is reused before Key Vault is queried again
+SECRET_CACHE_TTL_SECONDS = 3600
+
+# Secret name -> (value, monotonic expiry timestamp)
+_secret_cache: dict[str, tuple[str, float]] = {}
+
+
+def get_cached_secret(secret_client, secret_name: str) -> str:
+    """
+    Retrieve a secret from Key Vault, reusing the cached value while it is fresh.
+
+    Args:
+        secret_client: Azure Key Vault SecretClient used on cache miss
+        secret_name: Name of the secret (e.g., "GOOGLE-API-KEY")
+
+    Returns:
+        str: Secret value
+
+    Raises:
+        KeyVaultError: If the retrieved secret is empty
+        Exception: Any error raised by the SecretClient is propagated as-is
+    """
+    now = time.monotonic()
+    cached = _secret_cache.get(secret_name)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    logging.info("Retrieving %s from Key Vault", secret_name)
+    value = secret_client.get_secret(secret_name).value
+    if not value:
+        raise KeyVaultError(f"Retrieved secret '{secret_name}' is empty or None")
+
+    _secret_cache[secret_name] = (value, now + SECRET_CACHE_TTL_SECONDS)
+    return value
+
+
+def prefetch_secrets(secret_client, secret_names: list[str]) -> None:
+    """
+    Load several secrets into the cache concurrently.
+
+    Each Key Vault read is an independent round trip, so fetching the secrets
+    in parallel costs about one round trip instead of one per secret. Failures
+    are logged and left for the owning service to hit (and report) on use.
+
+    Args:
+        secret_client: Azure Key Vault SecretClient used on cache miss
+        secret_names: Names of the secrets to load
+    """
+    if not secret_names:
+        return
+
+    def fetch(secret_name: str) -> None:
+        try:
+            get_cached_secret(secret_client, secret_name)
+        except Exception as e:
+            logging.warning("Prefetch of %s failed: %s", secret_name, e)
+
+    with ThreadPoolExecutor(max_workers=len(secret_names), thread_name_prefix="kv-prefetch") as executor:
+        # Consume the iterator so every fetch has finished before returning
+        list(executor.map(fetch, secret_names))
+
+
+def clear_secret_cache():
+    """Clear all cached secrets (useful for testing or forcing a re-fetch)."""
+    _secret_cache.clear()
@@ -6,23 +6,49 @@ YouTube URLs, to prevent malicious attacks and ensure data integrity.
 """
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from utils.exceptions import InvalidYouTubeUrlError
 
 
 # YouTube domain whitelist
-ALLOWED_YOUTUBE_DOMAINS = {
+ALLOWED_YOUTUBE_DOMAINS = frozenset({
     'youtube.com',
     'www.youtube.com',
     'm.youtube.com',
     'youtu.be'
-}
+})
+
+# Cheap pre-filter: every valid URL starts with https:// and a whitelisted domain
+ALLOWED_URL_PREFIXES = tuple(f"https://{domain}/" for domain in sorted(ALLOWED_YOUTUBE_DOMAINS))
 
 # YouTube video ID regex pattern (11 characters: alphanumeric, underscore, hyphen)
 VIDEO_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{11}$')
 
 # Allowed query parameters (security: only allow known safe parameters)
-ALLOWED_QUERY_PARAMS = {'v', 't', 'list', 'index', 'start'}
+ALLOWED_QUERY_PARAMS = frozenset({'v', 't', 'list', 'index', 'start'})
+
+# Safe query parameter value pattern (alphanumeric, underscore, hyphen)
+SAFE_PARAM_VALUE_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# Obviously malicious patterns rejected before parsing (matched case-insensitively)
+MALICIOUS_PATTERNS = (
+    '../',           # Path traversal
+    './',            # Path traversal
+    '%2e%2e',       # Encoded path traversal
+    '%2e%2f',       # Encoded path traversal
+    '<script',       # Script injection
+    'javascript:',   # JavaScript protocol
+    'data:',         # Data protocol
+    'file:',         # File protocol
+    'ftp:',          # FTP protocol
+)
+
+# Number of distinct sanitized URLs memoized (retries of the same video hit the cache)
+URL_CACHE_SIZE = 1024
+
+# Longer inputs are rejected before the cache so adversarial keys can't inflate it
+MAX_URL_LENGTH = 2048
 
 
 def validate_youtube_url(url: str) -> str:
@@ -30,6 +56,8 @@ def validate_youtube_url(url: str) -> str:
     Validates and sanitizes YouTube URL for security.
     
     Security checks:
+    - Rejects URLs longer than MAX_URL_LENGTH
+    - Rejects anything not starting with an HTTPS YouTube prefix before parsing
     - Enforces HTTPS scheme only
     - Validates domain against whitelist
     - Extracts and validates video ID format
@@ -61,24 +89,43 @@ def validate_youtube_url(url: str) -> str:
     if not url or not isinstance(url, str):
         raise InvalidYouTubeUrlError("URL must be a non-empty string")
     
+    if len(url) > MAX_URL_LENGTH:
+        raise InvalidYouTubeUrlError(f"URL exceeds maximum length of {MAX_URL_LENGTH} characters")
+    
     # Remove leading/trailing whitespace
-    url = url.strip()
+    return _sanitize_youtube_url(url.strip())
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _sanitize_youtube_url(url: str) -> str:
+    """
+    Validate and sanitize a stripped URL string (cached).
     
-    # Check for obviously malicious patterns before parsing
-    malicious_patterns = [
-        '../',           # Path traversal
-        './',            # Path traversal
-        '%2e%2e',       # Encoded path traversal
-        '%2e%2f',       # Encoded path traversal
-        '<script',       # Script injection (case-insensitive check below)
-        'javascript:',   # JavaScript protocol
-        'data:',         # Data protocol
-        'file:',         # File protocol
-        'ftp:',          # FTP protocol
-    ]
+    Sanitization is a pure function of the URL, so results are memoized;
+    clients retrying the same video skip the pattern scan and parsing.
+    Invalid URLs raise and are therefore never cached.
     
+    Args:
+        url: Stripped YouTube URL to validate
+        
+    Returns:
+        Sanitized YouTube URL in standard format
+        
+    Raises:
+        InvalidYouTubeUrlError: If URL is invalid, malicious, or not from YouTube
+    """
     url_lower = url.lower()
-    for pattern in malicious_patterns:
+    
+    # Fast rejection of non-YouTube input before any pattern scan or parsing
+    if not url_lower.startswith(ALLOWED_URL_PREFIXES):
+        if not url_lower.startswith('https://'):
+            raise InvalidYouTubeUrlError("Only HTTPS URLs are allowed. YouTube uses HTTPS.")
+        raise InvalidYouTubeUrlError(
+            f"Invalid YouTube URL. Must start with one of: {', '.join(ALLOWED_URL_PREFIXES)}"
+        )
+    
+    # Check for obviously malicious patterns before parsing
+    for pattern in MALICIOUS_PATTERNS:
         if pattern in url_lower:
             raise InvalidYouTubeUrlError(f"URL contains potentially malicious pattern: {pattern}")
     
@@ -158,7 +205,7 @@ def validate_youtube_url(url: str) -> str:
                 # Only keep first value and validate it's safe
                 value = values[0]
                 # Basic validation: alphanumeric, underscore, hyphen only
-                if re.match(r'^[a-zA-Z0-9_-]+$', value):
+                if SAFE_PARAM_VALUE_PATTERN.match(value):
                     safe_params[param] = value
     
     # Always include video ID in v parameter